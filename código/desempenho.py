@@ -0,0 +1,241 @@
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+TIPOS_DE_DADOS = ("blobs", "geo")
+
+PRECISOES = ("dupla", "simples")
+
+FUNCOES = ("rotula_dados", "centraliza_centroides", "roda_k_means", "roda_k_means_acelerado", "clusteriza_dados")
+
+
+# noinspection SpellCheckingInspection
+def le_argumentos():
+    analisador = argparse.ArgumentParser(description="Mede o desempenho dos núcleos do K-Médias.")
+
+    analisador.add_argument("--observacoes", type=int, nargs="+", default=[1000, 10000, 100000])
+    analisador.add_argument("--dimensoes", type=int, nargs="+", default=[2, 8])
+    analisador.add_argument("--centroides", type=int, nargs="+", default=[4, 16])
+    analisador.add_argument("--execucoes", type=int, nargs="+", default=[1, 100])
+    analisador.add_argument("--threads", type=int, nargs="+", default=None)
+    analisador.add_argument("--dados", choices=TIPOS_DE_DADOS, nargs="+", default=list(TIPOS_DE_DADOS))
+    analisador.add_argument("--funcoes", choices=FUNCOES, nargs="+", default=list(FUNCOES))
+    analisador.add_argument("--precisoes", choices=PRECISOES, nargs="+", default=["dupla"])
+    analisador.add_argument("--repeticoes", type=int, default=5)
+    analisador.add_argument("--semente", type=int, default=0)
+    analisador.add_argument("--compilacao-fria", action="store_true")
+    analisador.add_argument("--saida", default=None)
+    analisador.add_argument("--compara", default=None)
+
+    return analisador.parse_args()
+
+
+# noinspection SpellCheckingInspection
+def gera_blobs(gerador, numero_de_observacoes, dimensionalidade, numero_de_grupos=8):
+    centros = gerador.uniform(-10.0, 10.0, (numero_de_grupos, dimensionalidade))
+    rotulos = gerador.integers(0, numero_de_grupos, numero_de_observacoes)
+
+    return centros[rotulos] + gerador.normal(0.0, 1.0, (numero_de_observacoes, dimensionalidade))
+
+
+# noinspection SpellCheckingInspection
+def gera_coordenadas(gerador, numero_de_observacoes, numero_de_bairros=40):
+    centros = np.column_stack(
+        (gerador.uniform(-48.55, -48.35, numero_de_bairros), gerador.uniform(-1.55, -1.25, numero_de_bairros))
+    )
+    rotulos = gerador.integers(0, numero_de_bairros, numero_de_observacoes)
+
+    return centros[rotulos] + gerador.normal(0.0, 0.005, (numero_de_observacoes, 2))
+
+
+# noinspection SpellCheckingInspection
+def gera_dados(tipo_de_dados, numero_de_observacoes, dimensionalidade, semente):
+    gerador = np.random.default_rng(semente)
+
+    if tipo_de_dados == "geo":
+        return gera_coordenadas(gerador, numero_de_observacoes)
+
+    return gera_blobs(gerador, numero_de_observacoes, dimensionalidade)
+
+
+# noinspection SpellCheckingInspection
+def prepara_funcao(funcao, dados, numero_de_centroides, numero_de_execucoes, metrica, precisao, semente):
+    from kmedias import KMedias, metricas, operadores
+
+    dtype = np.float64 if metrica == metricas.GEODESICA else KMedias.PRECISOES[precisao]
+    dados_de_trabalho = np.ascontiguousarray(metricas.projeta(dados, metrica), dtype=dtype)
+    centroides = dados_de_trabalho[np.linspace(0, dados.shape[0] - 1, numero_de_centroides).astype(np.int_)]
+    centroides_fixos = np.zeros(numero_de_centroides, dtype=np.bool_)
+    esferico = metrica == metricas.GEODESICA
+
+    if funcao == "rotula_dados":
+        return lambda: operadores.rotula_dados(dados_de_trabalho, centroides)
+    elif funcao == "centraliza_centroides":
+        rotulos = operadores.rotula_dados(dados_de_trabalho, centroides)
+
+        return lambda: operadores.centraliza_centroides(
+            dados_de_trabalho, centroides, centroides_fixos, rotulos, esferico
+        )
+    elif funcao in ("roda_k_means", "roda_k_means_acelerado"):
+        acelerado = funcao == "roda_k_means_acelerado"
+
+        return lambda: operadores.roda_k_means(
+            dados_de_trabalho, centroides.copy(), centroides_fixos, 1e-4, 1000, acelerado, operadores.DESLOCAMENTO,
+            esferico
+        )
+
+    def clusteriza_dados():
+        operadores.semeia_gerador(semente)
+        np.random.seed(semente)
+
+        k_medias = KMedias(numero_de_centroides=numero_de_centroides, metrica=metrica, precisao=precisao)
+        k_medias.clusteriza_dados(dados=dados, centroides_fixos=None, numero_de_execucoes=numero_de_execucoes)
+
+    return clusteriza_dados
+
+
+# noinspection SpellCheckingInspection
+def cronometra(executavel, repeticoes):
+    tempos = []
+
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        executavel()
+        tempos.append(time.perf_counter() - inicio)
+
+    return tempos
+
+
+# noinspection SpellCheckingInspection
+def mede_compilacao(argumentos):
+    import numba as nb
+
+    resultados = []
+
+    for tipo_de_dados, funcao in itertools.product(argumentos.dados, argumentos.funcoes):
+        metrica = "geodesica" if tipo_de_dados == "geo" else "euclidiana"
+        dados = gera_dados(tipo_de_dados, 256, 2, argumentos.semente)
+        executavel = prepara_funcao(funcao, dados, 4, 2, metrica, argumentos.precisoes[0], argumentos.semente)
+        primeira_chamada = cronometra(executavel, 1)[0]
+        chamadas_seguintes = cronometra(executavel, argumentos.repeticoes)
+
+        resultados.append(
+            {
+                "tipo": "compilacao", "funcao": funcao, "dados": tipo_de_dados, "threads": nb.get_num_threads(),
+                "primeira_chamada": primeira_chamada, "compilacao": primeira_chamada - min(chamadas_seguintes),
+            }
+        )
+
+    return resultados
+
+
+# noinspection SpellCheckingInspection
+def mede_regime_permanente(argumentos):
+    import numba as nb
+
+    resultados = []
+    numeros_de_threads = sorted(
+        {min(numero_de_threads, nb.config.NUMBA_NUM_THREADS) for numero_de_threads in argumentos.threads}
+    ) if argumentos.threads else [nb.config.NUMBA_NUM_THREADS]
+    casos = itertools.product(
+        argumentos.dados, argumentos.precisoes, argumentos.observacoes, argumentos.dimensoes, argumentos.centroides,
+        numeros_de_threads
+    )
+
+    for caso in casos:
+        tipo_de_dados, precisao, numero_de_observacoes, dimensionalidade, numero_de_centroides, numero_de_threads = caso
+
+        if tipo_de_dados == "geo" and (dimensionalidade != argumentos.dimensoes[0] or precisao != "dupla"):
+            continue
+
+        metrica = "geodesica" if tipo_de_dados == "geo" else "euclidiana"
+        dados = gera_dados(tipo_de_dados, numero_de_observacoes, dimensionalidade, argumentos.semente)
+
+        nb.set_num_threads(numero_de_threads)
+
+        for funcao in argumentos.funcoes:
+            execucoes = argumentos.execucoes if funcao == "clusteriza_dados" else [1]
+
+            for numero_de_execucoes in execucoes:
+                executavel = prepara_funcao(
+                    funcao, dados, numero_de_centroides, numero_de_execucoes, metrica, precisao, argumentos.semente
+                )
+                executavel()
+                tempos = cronometra(executavel, argumentos.repeticoes)
+
+                resultados.append(
+                    {
+                        "tipo": "regime_permanente", "funcao": funcao, "dados": tipo_de_dados, "precisao": precisao,
+                        "observacoes": numero_de_observacoes, "dimensoes": dados.shape[1],
+                        "centroides": numero_de_centroides, "execucoes": numero_de_execucoes,
+                        "threads": nb.get_num_threads(), "minimo": min(tempos), "mediana": float(np.median(tempos)),
+                        "tempos": tempos,
+                    }
+                )
+
+                print(json.dumps({chave: valor for chave, valor in resultados[-1].items() if chave != "tempos"}))
+
+    return resultados
+
+
+# noinspection SpellCheckingInspection
+def descreve_ambiente():
+    import numba as nb
+
+    return {
+        "python": sys.version.split()[0], "numpy": np.__version__, "numba": nb.__version__,
+        "plataforma": platform.platform(), "processador": platform.processor(), "cpus": os.cpu_count(),
+        "threads_do_numba": nb.config.NUMBA_NUM_THREADS, "camada_de_threads": nb.threading_layer(),
+    }
+
+
+# noinspection SpellCheckingInspection
+def chave_do_caso(resultado):
+    return tuple(
+        resultado.get(campo) for campo in
+        ("tipo", "funcao", "dados", "precisao", "observacoes", "dimensoes", "centroides", "execucoes", "threads")
+    )
+
+
+# noinspection SpellCheckingInspection
+def compara(resultados, caminho_da_referencia):
+    with open(caminho_da_referencia) as arquivo:
+        referencia = {chave_do_caso(resultado): resultado for resultado in json.load(arquivo)["resultados"]}
+
+    for resultado in resultados:
+        anterior = referencia.get(chave_do_caso(resultado))
+
+        if anterior is None or resultado["tipo"] != "regime_permanente":
+            continue
+
+        razao = resultado["mediana"] / anterior["mediana"]
+        caso = " ".join(f"{valor}" for valor in chave_do_caso(resultado)[1:])
+
+        print(f"{caso}: {anterior['mediana']:.6f}s -> {resultado['mediana']:.6f}s ({razao:.2f}x)")
+
+
+if __name__ == "__main__":
+    # noinspection SpellCheckingInspection
+    argumentos = le_argumentos()
+
+    if argumentos.compilacao_fria:
+        os.environ["NUMBA_CACHE_DIR"] = tempfile.mkdtemp()
+
+    # noinspection SpellCheckingInspection
+    relatorio = {"argumentos": vars(argumentos)}
+    relatorio["resultados"] = mede_compilacao(argumentos) + mede_regime_permanente(argumentos)
+    relatorio["ambiente"] = descreve_ambiente()
+
+    if argumentos.saida is not None:
+        with open(argumentos.saida, "w") as arquivo:
+            json.dump(relatorio, arquivo, indent=2)
+
+    if argumentos.compara is not None:
+        compara(relatorio["resultados"], argumentos.compara)
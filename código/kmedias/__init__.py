@@ -1 +1,7 @@
+import numba as nb
+
+from .aquecimento import aquece
 from .kmedias import KMedias
+
+# As funções carregadas do cache em disco não iniciam sozinhas as threads do numba usadas pelos núcleos paralelos.
+nb.get_num_threads()
@@ -0,0 +1,75 @@
+import numpy as np
+
+from . import fora_da_memoria
+from . import instrumentacao
+from . import metricas
+from . import operadores
+from . import varredura
+from .kmedias import KMedias
+
+CONFIGURACOES = ((metricas.EUCLIDIANA, "dupla"), (metricas.EUCLIDIANA, "simples"), (metricas.GEODESICA, "dupla"))
+
+
+# noinspection SpellCheckingInspection
+def gera_dados_de_aquecimento():
+    longitudes = np.linspace(-48.5, -48.4, 2 * operadores.TAMANHO_DO_BLOCO)
+    latitudes = np.tile(np.linspace(-1.5, -1.3, 64), longitudes.shape[0] // 64)
+
+    return np.column_stack((longitudes, latitudes))
+
+
+# noinspection SpellCheckingInspection
+def aquece():
+    dados = gera_dados_de_aquecimento()
+    centroides_fixos = dados[:1].copy()
+
+    for metrica, precisao in CONFIGURACOES:
+        for inicializacao in KMedias.INICIALIZACOES:
+            k_medias = KMedias(
+                numero_de_centroides=3, inicializacao=inicializacao, metrica=metrica, precisao=precisao
+            )
+            k_medias.clusteriza_dados(dados=dados, centroides_fixos=centroides_fixos, numero_de_execucoes=2)
+
+        for acelerado in (False, True):
+            k_medias = KMedias(numero_de_centroides=3, acelerado=acelerado, metrica=metrica, precisao=precisao)
+            k_medias._clusteriza_dados(dados=dados, centroides_fixos=centroides_fixos)
+            k_medias.calcula_erro_da_solucao(k_medias.centroides)
+
+        k_medias.dados = dados
+        k_medias.erro
+
+        for observacoes in (dados[0], dados[:8], dados):
+            k_medias.prediz(dados=observacoes)
+            k_medias.transforma(dados=observacoes)
+
+        k_medias.adiciona_observacoes(dados=dados[:8])
+        k_medias.substitui_observacoes(indices=[0, 1], dados=dados[2:4])
+        k_medias.remove_observacoes(indices=[0])
+        k_medias.reajusta()
+
+        k_medias = KMedias(
+            numero_de_centroides=3, metrica=metrica, precisao=precisao, registrador=instrumentacao.Registrador()
+        )
+        k_medias.clusteriza_dados(dados=dados, centroides_fixos=centroides_fixos, numero_de_execucoes=1)
+        k_medias.acelerado = True
+        k_medias._clusteriza_dados(dados=dados, centroides_fixos=centroides_fixos)
+        k_medias.clusteriza_em_lotes(lotes=[dados[:64], dados[64:128]], centroides_fixos=centroides_fixos)
+
+        varredura.varre_numeros_de_centroides(
+            dados=dados, numeros_de_centroides=(2, 3), centroides_fixos=centroides_fixos, numero_de_execucoes=2,
+            tamanho_da_amostra=64, metrica=metrica, precisao=precisao
+        )
+
+    for dtype in KMedias.PRECISOES.values():
+        dados_somente_leitura = dados.astype(dtype)
+        dados_somente_leitura.flags.writeable = False
+        centroides, _, _ = fora_da_memoria.roda_k_means_em_blocos(
+            dados_somente_leitura, dados_somente_leitura[:3].copy(), np.array([True, False, False])
+        )
+        fora_da_memoria.roda_k_means_em_blocos(
+            dados_somente_leitura, dados_somente_leitura[:3].copy(), np.array([True, False, False]),
+            registro=instrumentacao.cria_registro(1000)
+        )
+
+        fora_da_memoria.calcula_resultado_da_solucao_em_blocos(dados_somente_leitura, centroides)
+        fora_da_memoria.calcula_erro_da_solucao_em_blocos(dados_somente_leitura, centroides)
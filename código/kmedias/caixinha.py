@@ -3,67 +3,124 @@ import numpy as np
 
 
 # noinspection SpellCheckingInspection
-@nb.jit(nopython=True, parallel=True)
-def arredonda_matriz(matriz, casas_decimais):
-    vetor = matriz.copy().ravel()
-    comprimento = vetor.shape[0]
+@nb.jit(nopython=True, cache=True)
+def calcula_distancia_entre_grupos(grupo_um, grupo_dois, tira_raiz=True, normas_um=None, normas_dois=None):
+    if normas_um is None:
+        normas_um = calcula_normas_quadradas(grupo_um)
 
-    for i in nb.prange(comprimento):
-        vetor[i] = np.round_(vetor[i], casas_decimais)
+    if normas_dois is None:
+        normas_dois = calcula_normas_quadradas(grupo_dois)
 
-    matriz_arredondada = vetor.reshape(matriz.shape)
+    distancias = np.dot(grupo_um, grupo_dois.T)
+    comprimento_um, comprimento_dois = distancias.shape
 
-    return matriz_arredondada
+    for i_um in range(comprimento_um):
+        for i_dois in range(comprimento_dois):
+            distancia = -2.0 * distancias[i_um, i_dois] + normas_um[i_um] + normas_dois[i_dois]
 
+            if distancia < 0.0:
+                distancia = 0.0
 
-# noinspection SpellCheckingInspection
-@nb.jit(nopython=True, parallel=True)
-def calcula_distancia_entre_grupos(grupo_um, grupo_dois, tira_raiz=True):
-    comprimento_um, comprimento_dois = grupo_um.shape[0], grupo_dois.shape[0]
-    distancias = np.empty(shape=(comprimento_um, comprimento_dois))
+            if tira_raiz is True:
+                distancia = np.sqrt(distancia)
 
-    for i_um in nb.prange(comprimento_um):
-        for i_dois in nb.prange(comprimento_dois):
-            distancias[i_um, i_dois] = calcula_distancia_entre_observacoes(
-                grupo_um[i_um, :], grupo_dois[i_dois, :], tira_raiz
-            )
+            distancias[i_um, i_dois] = distancia
 
     return distancias
 
 
 # noinspection SpellCheckingInspection
-@nb.jit(nopython=True, parallel=True)
-def calcula_distancia_entre_observacoes(vetor_um, vetor_dois, tira_raiz):
-    comprimento = vetor_um.shape[0]
-    diferencas = np.empty(shape=comprimento)
+@nb.jit(nopython=True, parallel=True, cache=True)
+def tira_media_das_colunas(dados):
+    numero_de_observacoes, dimensionalidade = dados.shape
+    media_das_colunas_dos_dados = np.empty(shape=dimensionalidade)
+
+    for f in nb.prange(dimensionalidade):
+        soma = 0.0
+
+        for o in range(numero_de_observacoes):
+            soma += dados[o, f]
+
+        media_das_colunas_dos_dados[f] = soma / numero_de_observacoes
+
+    return media_das_colunas_dos_dados
 
-    for i in nb.prange(comprimento):
-        diferencas[i] = np.square(vetor_um[i] - vetor_dois[i])
 
-    distancia = np.sum(diferencas)
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def calcula_distancia_quadrada_entre_observacoes(vetor_um, vetor_dois):
+    distancia = 0.0
 
-    if tira_raiz is True:
-        distancia = np.sqrt(distancia)
+    for i in range(vetor_um.shape[0]):
+        diferenca = vetor_um[i] - vetor_dois[i]
+        distancia += diferenca * diferenca
 
     return distancia
 
 
-# noinspection SpellCheckingInspection,PyUnresolvedReferences
-@nb.jit(nopython=True)
-def verifica_igualdade_aproximada_entre_grupos(grupo_um, grupo_dois, casas_decimais):
-    grupo_um, grupo_dois = arredonda_matriz(grupo_um, casas_decimais), arredonda_matriz(grupo_dois, casas_decimais)
-    ha_igualdade = bool((grupo_um == grupo_dois).all())
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, parallel=True, cache=True)
+def calcula_metade_da_menor_distancia_entre_centroides(centroides):
+    numero_de_centroides = centroides.shape[0]
+    metades_das_menores_distancias = np.full(numero_de_centroides, np.inf)
+
+    for i_um in nb.prange(numero_de_centroides):
+        for i_dois in range(numero_de_centroides):
+            if i_um != i_dois:
+                distancia = np.sqrt(
+                    calcula_distancia_quadrada_entre_observacoes(centroides[i_um, :], centroides[i_dois, :])
+                )
 
-    return ha_igualdade
+                if 0.5 * distancia < metades_das_menores_distancias[i_um]:
+                    metades_das_menores_distancias[i_um] = 0.5 * distancia
+
+    return metades_das_menores_distancias
 
 
 # noinspection SpellCheckingInspection
-@nb.jit(nopython=True, parallel=True)
-def tira_media_das_colunas(dados):
-    dimensionalidade = dados.shape[1]
-    media_das_colunas_dos_dados = np.empty(shape=dimensionalidade)
+@nb.jit(nopython=True, parallel=True, cache=True)
+def calcula_normas_quadradas(grupo):
+    comprimento = grupo.shape[0]
+    normas = np.empty(comprimento)
 
-    for f in nb.prange(dimensionalidade):
-        media_das_colunas_dos_dados[f] = dados[:, f].mean()
+    for i in nb.prange(comprimento):
+        norma = 0.0
 
-    return media_das_colunas_dos_dados
+        for f in range(grupo.shape[1]):
+            norma += grupo[i, f] * grupo[i, f]
+
+        normas[i] = norma
+
+    return normas
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def calcula_deslocamento_quadrado_entre_grupos(grupo_um, grupo_dois):
+    deslocamento = 0.0
+
+    for i in range(grupo_um.shape[0]):
+        deslocamento += calcula_distancia_quadrada_entre_observacoes(grupo_um[i, :], grupo_dois[i, :])
+
+    return deslocamento
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, parallel=True, cache=True)
+def conta_diferencas(vetor_um, vetor_dois):
+    diferencas = 0
+
+    for i in nb.prange(vetor_um.shape[0]):
+        if vetor_um[i] != vetor_dois[i]:
+            diferencas += 1
+
+    return diferencas
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def calcula_variancia_media(dados, normas):
+    media_das_colunas_dos_dados = tira_media_das_colunas(dados)
+    variancia = normas.mean() - (media_das_colunas_dos_dados * media_das_colunas_dos_dados).sum()
+
+    return max(variancia / dados.shape[1], np.finfo(np.float64).tiny)
@@ -0,0 +1,144 @@
+import hashlib
+import json
+import os
+import warnings
+
+import numpy as np
+
+TAMANHO_DO_TRECHO_DE_LEITURA = 2 ** 20
+
+
+# noinspection SpellCheckingInspection
+def converte_coordenadas(textos, separador=","):
+    if textos.isna().any():
+        raise ValueError("As coordenadas não podem conter valores ausentes.")
+
+    valores = np.empty(0)
+
+    if len(textos) > 0:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+
+            try:
+                valores = np.fromstring(f"{separador} ".join(textos.tolist()), sep=separador)
+            except DeprecationWarning:
+                valores = None
+
+    if valores is None or valores.shape[0] != 2 * len(textos):
+        raise ValueError(f"As coordenadas precisam estar no formato \"latitude{separador} longitude\".")
+
+    return np.ascontiguousarray(valores.reshape(-1, 2)[:, ::-1])
+
+
+# noinspection SpellCheckingInspection
+def le_coordenadas(caminho, *, coluna="Coordenadas", separador=",", tamanho_do_pedaco=None):
+    import pandas as pd
+
+    leitura = pd.read_csv(caminho, usecols=[coluna], dtype={coluna: str}, chunksize=tamanho_do_pedaco)
+
+    if tamanho_do_pedaco is None:
+        return converte_coordenadas(leitura[coluna], separador)
+
+    try:
+        coordenadas = [converte_coordenadas(pedaco[coluna], separador) for pedaco in leitura]
+    finally:
+        leitura.close()
+
+    return np.concatenate(coordenadas) if coordenadas else np.empty((0, 2))
+
+
+# noinspection SpellCheckingInspection
+def calcula_hash(caminho):
+    resumo = hashlib.sha256()
+
+    with open(caminho, "rb") as arquivo:
+        for trecho in iter(lambda: arquivo.read(TAMANHO_DO_TRECHO_DE_LEITURA), b""):
+            resumo.update(trecho)
+
+    return resumo.hexdigest()
+
+
+# noinspection SpellCheckingInspection
+def caminhos_do_cache(caminho, diretorio_do_cache):
+    caminho = os.path.abspath(caminho)
+
+    if diretorio_do_cache is None:
+        diretorio_do_cache = os.path.join(os.path.dirname(caminho), "__cache__")
+
+    nome = f"{os.path.basename(caminho)}.{hashlib.sha256(caminho.encode()).hexdigest()[:16]}"
+
+    return diretorio_do_cache, os.path.join(diretorio_do_cache, f"{nome}.npy"), os.path.join(
+        diretorio_do_cache, f"{nome}.json"
+    )
+
+
+# noinspection SpellCheckingInspection
+def verifica_cache(caminho, caminho_dos_metadados, parametros):
+    if not os.path.exists(caminho_dos_metadados):
+        return False, None
+
+    with open(caminho_dos_metadados) as arquivo:
+        metadados = json.load(arquivo)
+
+    informacoes = os.stat(caminho)
+
+    if metadados.get("parametros") != parametros or metadados.get("tamanho") != informacoes.st_size:
+        return False, None
+
+    if metadados.get("modificacao") == informacoes.st_mtime_ns:
+        return True, None
+
+    hash_do_arquivo = calcula_hash(caminho)
+
+    return metadados.get("hash") == hash_do_arquivo, hash_do_arquivo
+
+
+# noinspection SpellCheckingInspection
+def salva_atomicamente(caminho, escreve, modo):
+    caminho_temporario = f"{caminho}.{os.getpid()}.tmp"
+
+    try:
+        with open(caminho_temporario, modo) as arquivo:
+            escreve(arquivo)
+
+        os.replace(caminho_temporario, caminho)
+    finally:
+        if os.path.exists(caminho_temporario):
+            os.remove(caminho_temporario)
+
+
+# noinspection SpellCheckingInspection
+def salva_metadados(caminho, caminho_dos_metadados, parametros, hash_do_arquivo):
+    informacoes = os.stat(caminho)
+    metadados = {
+        "parametros": parametros, "tamanho": informacoes.st_size, "modificacao": informacoes.st_mtime_ns,
+        "hash": hash_do_arquivo,
+    }
+
+    salva_atomicamente(caminho_dos_metadados, lambda arquivo: json.dump(metadados, arquivo), "w")
+
+
+# noinspection SpellCheckingInspection
+def carrega_coordenadas(
+    caminho, *, coluna="Coordenadas", separador=",", tamanho_do_pedaco=None, diretorio_do_cache=None,
+    mapeia_na_memoria=False
+):
+    diretorio_do_cache, caminho_do_cache, caminho_dos_metadados = caminhos_do_cache(caminho, diretorio_do_cache)
+    parametros = {"coluna": coluna, "separador": separador}
+    cache_valido, hash_do_arquivo = verifica_cache(caminho, caminho_dos_metadados, parametros)
+
+    if cache_valido and os.path.exists(caminho_do_cache):
+        if hash_do_arquivo is not None:
+            salva_metadados(caminho, caminho_dos_metadados, parametros, hash_do_arquivo)
+    else:
+        hash_do_arquivo = calcula_hash(caminho) if hash_do_arquivo is None else hash_do_arquivo
+        coordenadas = le_coordenadas(
+            caminho, coluna=coluna, separador=separador, tamanho_do_pedaco=tamanho_do_pedaco
+        )
+
+        os.makedirs(diretorio_do_cache, exist_ok=True)
+
+        salva_atomicamente(caminho_do_cache, lambda arquivo: np.save(arquivo, coordenadas), "wb")
+        salva_metadados(caminho, caminho_dos_metadados, parametros, hash_do_arquivo)
+
+    return np.load(caminho_do_cache, mmap_mode="r" if mapeia_na_memoria else None)
@@ -92,6 +92,18 @@ def verifica_ndim(**parametros):
             raise ValueError(f"O o atributo ndim do {descricao} {parametro} precisa ser igual a {ndim}.")
 
 
+# noinspection SpellCheckingInspection
+def verifica_pertencimento(**parametros):
+    for parametro in parametros.keys():
+        valor, descricao, valores_possiveis = parametros[parametro]
+
+        if valor not in valores_possiveis:
+            raise ValueError(
+                f"O {descricao} {parametro} precisa receber um dos seguintes valores: "
+                f"{', '.join(map(str, valores_possiveis))}."
+            )
+
+
 # noinspection SpellCheckingInspection
 def verifica_tipo(**parametro_dict):
     numero_de_parametros = len(parametro_dict.keys())
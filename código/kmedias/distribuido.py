@@ -0,0 +1,145 @@
+import time
+
+import numpy as np
+
+from . import caixinha
+from . import checagens
+from . import fora_da_memoria
+from . import metricas
+from . import operadores
+from .kmedias import KMedias
+
+
+# noinspection SpellCheckingInspection
+def resume_particao(particao):
+    return particao.sum(axis=0, dtype=np.float64), caixinha.calcula_normas_quadradas(particao).sum(), particao.shape[0]
+
+
+# noinspection SpellCheckingInspection
+def acumula_particao(particao, normas_da_particao, centroides):
+    rotulos, distancias, somas, numero_de_membros, erro_dos_agrupamentos = operadores.rotula_e_acumula(
+        particao, centroides, normas_da_particao
+    )
+    candidatos = fora_da_memoria.seleciona_candidatos_a_reparo(
+        particao, rotulos, distancias, fora_da_memoria.conta_candidatos_a_reparo(centroides.shape[0])
+    )
+
+    return somas, numero_de_membros, erro_dos_agrupamentos, candidatos
+
+
+# noinspection SpellCheckingInspection
+def soma_parciais(parciais):
+    somas, numero_de_membros, erro_dos_agrupamentos, candidatos = parciais[0]
+    numero_de_candidatos = fora_da_memoria.conta_candidatos_a_reparo(somas.shape[0])
+
+    for outras_somas, outros_numeros_de_membros, outros_erros, outros_candidatos in parciais[1:]:
+        somas, numero_de_membros = somas + outras_somas, numero_de_membros + outros_numeros_de_membros
+        erro_dos_agrupamentos = erro_dos_agrupamentos + outros_erros
+        candidatos = fora_da_memoria.junta_candidatos_a_reparo(candidatos, outros_candidatos, numero_de_candidatos)
+
+    return somas, numero_de_membros, erro_dos_agrupamentos, candidatos
+
+
+# noinspection SpellCheckingInspection
+def prepara_particao(particao, origem, dtype):
+    if origem is not None:
+        particao = particao - origem
+
+    return np.ascontiguousarray(particao, dtype=dtype)
+
+
+# noinspection SpellCheckingInspection
+def particiona(dados, metrica):
+    import dask.array as da
+
+    dados = da.asarray(dados)
+
+    checagens.verifica_ndim(dados=(dados, "parâmetro", 2))
+
+    dados = dados.rechunk({1: -1})
+
+    if metrica == metricas.GEODESICA:
+        dados = dados.map_blocks(
+            metricas.projeta, metrica, chunks=(dados.chunks[0], (3,)), dtype=np.float64
+        )
+
+    return dados
+
+
+# noinspection SpellCheckingInspection
+def rotula_distribuido(*, dados, centroides, metrica=metricas.EUCLIDIANA):
+    centroides = np.ascontiguousarray(metricas.projeta(centroides, metrica), dtype=np.float64)
+
+    return particiona(dados, metrica).map_blocks(
+        lambda particao: operadores.rotula_dados(np.ascontiguousarray(particao, dtype=np.float64), centroides),
+        drop_axis=1, dtype=np.int_
+    )
+
+
+# noinspection SpellCheckingInspection
+def acumula_distribuido(particoes, normas, centroides):
+    import dask
+
+    parciais = [
+        dask.delayed(acumula_particao)(particao, normas_da_particao, centroides)
+        for particao, normas_da_particao in zip(particoes, normas)
+    ]
+
+    return dask.compute(dask.delayed(soma_parciais)(parciais))[0]
+
+
+# noinspection SpellCheckingInspection
+def clusteriza_distribuido(*, dados, numero_de_centroides, centroides_fixos=None, semente=None, **parametros):
+    import dask
+
+    k_medias = KMedias(numero_de_centroides=numero_de_centroides, **parametros)
+    criterio_de_parada = KMedias.CRITERIOS_DE_PARADA[k_medias.criterio_de_parada]
+
+    if criterio_de_parada == operadores.ROTULOS:
+        raise ValueError("O ajuste distribuído não guarda os rótulos e não pode usá-los como critério.")
+
+    dados = particiona(dados, k_medias.metrica)
+    resumos = dask.compute(*[dask.delayed(resume_particao)(particao) for particao in dados.to_delayed().ravel()])
+    soma_das_colunas, soma_das_normas, numero_de_observacoes = (sum(resumo) for resumo in zip(*resumos))
+    media_das_colunas_dos_dados = soma_das_colunas / numero_de_observacoes
+    variancia = soma_das_normas / numero_de_observacoes - (media_das_colunas_dos_dados ** 2).sum()
+    variancia = max(variancia / dados.shape[1], np.finfo(np.float64).tiny)
+
+    origem = None if k_medias.esferico or k_medias.dtype == np.float64 else media_das_colunas_dos_dados
+    dados = dados.map_blocks(prepara_particao, origem, k_medias.dtype, dtype=k_medias.dtype)
+    dados = dados.persist()
+    particoes = dados.to_delayed().ravel()
+    normas = dask.persist(*[dask.delayed(caixinha.calcula_normas_quadradas)(particao) for particao in particoes])
+
+    centroides, mascara_dos_fixos = np.empty((0, dados.shape[1]), dtype=k_medias.dtype), []
+
+    if centroides_fixos is not None:
+        centroides = metricas.projeta(np.asarray(centroides_fixos)[:numero_de_centroides], k_medias.metrica)
+        centroides = prepara_particao(centroides, origem, k_medias.dtype)
+        mascara_dos_fixos = centroides.shape[0] * [True]
+
+    centroides_faltantes = numero_de_centroides - centroides.shape[0]
+    indices = np.sort(np.random.default_rng(semente).choice(dados.shape[0], centroides_faltantes, replace=False))
+    centroides = np.ascontiguousarray(np.concatenate((centroides, dados[indices].compute())))
+    centroides_fixos = np.array(mascara_dos_fixos + centroides_faltantes * [False])
+
+    registro, inicio = k_medias._cria_registro(), time.perf_counter()
+    centroides, _, reparos = fora_da_memoria.roda_k_means_a_partir_das_somas(
+        lambda centroides_atuais: acumula_distribuido(particoes, normas, centroides_atuais), variancia, centroides,
+        centroides_fixos, k_medias.tolerancia, k_medias.numero_maximo_de_iteracoes, criterio_de_parada,
+        k_medias.esferico, registro
+    )
+    _, numero_de_membros, erro_dos_agrupamentos, _ = acumula_distribuido(particoes, normas, centroides)
+    erro = np.inf if (numero_de_membros == 0).any() else metricas.converte_erros(
+        erro_dos_agrupamentos.sum(), k_medias.metrica
+    )
+
+    if k_medias.registrador is not None:
+        k_medias.registrador.registra_execucao(
+            registro=registro, tempo_total=time.perf_counter() - inicio, erro=float(erro), reparos=int(reparos)
+        )
+
+    if origem is not None:
+        centroides = centroides + origem
+
+    return metricas.desprojeta(centroides, k_medias.metrica), erro, reparos
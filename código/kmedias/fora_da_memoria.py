@@ -0,0 +1,210 @@
+import time
+
+import numpy as np
+
+from . import caixinha
+from . import instrumentacao
+from . import operadores
+
+TAMANHO_DO_BLOCO = 2 ** 20
+
+
+# noinspection SpellCheckingInspection
+def percorre_blocos(dados, tamanho_do_bloco=TAMANHO_DO_BLOCO):
+    numero_de_observacoes = dados.shape[0]
+
+    for inicio in range(0, numero_de_observacoes, tamanho_do_bloco):
+        fim = min(inicio + tamanho_do_bloco, numero_de_observacoes)
+
+        yield inicio, fim, np.asarray(dados[inicio:fim])
+
+
+# noinspection SpellCheckingInspection
+def conta_candidatos_a_reparo(numero_de_centroides):
+    # Cada agrupamento bloqueia no máximo uma observação de ser movida e cada reparo bloqueia outra, então as
+    # 2k + 1 observações mais distantes contêm a que o reparo em memória escolheria.
+    return 2 * numero_de_centroides + 1
+
+
+# noinspection SpellCheckingInspection
+def seleciona_candidatos_a_reparo(observacoes, rotulos, distancias, numero_de_candidatos):
+    if distancias.shape[0] > numero_de_candidatos:
+        indices = np.argpartition(-distancias, max(numero_de_candidatos - 1, 0))[:numero_de_candidatos]
+        observacoes, rotulos, distancias = observacoes[indices], rotulos[indices], distancias[indices]
+
+    return (
+        np.asarray(observacoes, dtype=np.float64), np.asarray(rotulos, dtype=np.int_),
+        np.asarray(distancias, dtype=np.float64)
+    )
+
+
+# noinspection SpellCheckingInspection
+def junta_candidatos_a_reparo(candidatos, outros_candidatos, numero_de_candidatos):
+    return seleciona_candidatos_a_reparo(
+        *(np.concatenate(campos) for campos in zip(candidatos, outros_candidatos)), numero_de_candidatos
+    )
+
+
+# noinspection SpellCheckingInspection
+def repara_agrupamentos_vazios_com_candidatos(
+    candidatos, somas, numero_de_membros, erro_dos_agrupamentos, centroides_fixos
+):
+    observacoes, rotulos, distancias = candidatos
+    rotulos_anteriores, distancias_anteriores = rotulos.copy(), distancias.copy()
+    observacoes_movidas = operadores.repara_agrupamentos_vazios(
+        rotulos, distancias, numero_de_membros, centroides_fixos
+    )
+
+    for d in observacoes_movidas:
+        somas[rotulos_anteriores[d]] -= observacoes[d]
+        somas[rotulos[d]] += observacoes[d]
+        erro_dos_agrupamentos[rotulos_anteriores[d]] -= distancias_anteriores[d]
+
+    return observacoes_movidas.shape[0]
+
+
+# noinspection SpellCheckingInspection
+def rotula_e_acumula_em_blocos(dados, centroides, tamanho_do_bloco=TAMANHO_DO_BLOCO, numero_de_candidatos=0):
+    numero_de_centroides, dimensionalidade = centroides.shape
+    somas = np.zeros((numero_de_centroides, dimensionalidade))
+    numero_de_membros = np.zeros(numero_de_centroides, dtype=np.int_)
+    erro_dos_agrupamentos = np.zeros(numero_de_centroides)
+    candidatos = (np.empty((0, dimensionalidade)), np.empty(0, dtype=np.int_), np.empty(0))
+
+    for _, _, bloco in percorre_blocos(dados, tamanho_do_bloco):
+        rotulos, distancias, somas_do_bloco, numero_de_membros_do_bloco, erro_do_bloco = operadores.rotula_e_acumula(
+            bloco, centroides, caixinha.calcula_normas_quadradas(bloco)
+        )
+
+        somas += somas_do_bloco
+        numero_de_membros += numero_de_membros_do_bloco
+        erro_dos_agrupamentos += erro_do_bloco
+        candidatos = junta_candidatos_a_reparo(
+            candidatos, seleciona_candidatos_a_reparo(bloco, rotulos, distancias, numero_de_candidatos),
+            numero_de_candidatos
+        )
+
+    return somas, numero_de_membros, erro_dos_agrupamentos, candidatos
+
+
+# noinspection SpellCheckingInspection
+def rotula_dados_em_blocos(dados, centroides, tamanho_do_bloco=TAMANHO_DO_BLOCO):
+    rotulos = np.empty(dados.shape[0], dtype=np.int_)
+
+    for inicio, fim, bloco in percorre_blocos(dados, tamanho_do_bloco):
+        rotulos[inicio:fim] = operadores.rotula_dados(bloco, centroides)
+
+    return rotulos
+
+
+# noinspection SpellCheckingInspection
+def calcula_resultado_da_solucao_em_blocos(dados, centroides, tamanho_do_bloco=TAMANHO_DO_BLOCO):
+    numero_de_observacoes, numero_de_centroides = dados.shape[0], centroides.shape[0]
+    rotulos, distancias = np.empty(numero_de_observacoes, dtype=np.int_), np.empty(numero_de_observacoes)
+    numero_de_membros = np.zeros(numero_de_centroides, dtype=np.int_)
+    erro_dos_agrupamentos = np.zeros(numero_de_centroides)
+
+    for inicio, fim, bloco in percorre_blocos(dados, tamanho_do_bloco):
+        resultado_do_bloco = operadores.calcula_resultado_da_solucao(
+            bloco, centroides, caixinha.calcula_normas_quadradas(bloco)
+        )
+        rotulos[inicio:fim], distancias[inicio:fim] = resultado_do_bloco.rotulos, resultado_do_bloco.distancias
+        numero_de_membros += resultado_do_bloco.numero_de_membros
+        erro_dos_agrupamentos += resultado_do_bloco.erro_dos_agrupamentos
+
+    resultado = operadores.ResultadoDoKMeans(
+        centroides, rotulos, distancias, erro_dos_agrupamentos, numero_de_membros, 0, np.full(3, -1, dtype=np.int_),
+        0
+    )
+
+    return resultado
+
+
+# noinspection SpellCheckingInspection
+def calcula_erro_da_solucao_em_blocos(dados, centroides, tamanho_do_bloco=TAMANHO_DO_BLOCO):
+    _, numero_de_membros, erro_dos_agrupamentos, _ = rotula_e_acumula_em_blocos(dados, centroides, tamanho_do_bloco)
+
+    if (numero_de_membros == 0).any():
+        return np.inf
+
+    erro_total = erro_dos_agrupamentos.sum()
+
+    return erro_total
+
+
+# noinspection SpellCheckingInspection
+def calcula_variancia_media_em_blocos(dados, tamanho_do_bloco=TAMANHO_DO_BLOCO):
+    numero_de_observacoes, dimensionalidade = dados.shape
+    soma_das_colunas, soma_das_normas = np.zeros(dimensionalidade), 0.0
+
+    for _, _, bloco in percorre_blocos(dados, tamanho_do_bloco):
+        soma_das_colunas += bloco.sum(axis=0)
+        soma_das_normas += caixinha.calcula_normas_quadradas(bloco).sum()
+
+    media_das_colunas_dos_dados = soma_das_colunas / numero_de_observacoes
+    variancia = soma_das_normas / numero_de_observacoes - (media_das_colunas_dos_dados ** 2).sum()
+
+    return max(variancia / dimensionalidade, np.finfo(np.float64).tiny)
+
+
+# noinspection SpellCheckingInspection
+def roda_k_means_a_partir_das_somas(
+    acumula, variancia, centroides, centroides_fixos, tolerancia=1e-4, numero_maximo_de_iteracoes=1000,
+    criterio_de_parada=operadores.DESLOCAMENTO, esferico=False, registro=None
+):
+    iteracoes_por_criterio, erro_anterior = np.full(3, -1, dtype=np.int_), np.inf
+    iteracao, reparos = 0, 0
+
+    while iteracao < numero_maximo_de_iteracoes:
+        inicio_da_rotulacao = time.perf_counter()
+        somas, numero_de_membros, erro_dos_agrupamentos, candidatos = acumula(centroides)
+        reparos_da_iteracao = repara_agrupamentos_vazios_com_candidatos(
+            candidatos, somas, numero_de_membros, erro_dos_agrupamentos, centroides_fixos
+        )
+        reparos += reparos_da_iteracao
+        inicio_da_atualizacao = time.perf_counter()
+        centroides_centralizados = operadores.calcula_centroides_a_partir_das_somas(
+            centroides, centroides_fixos, somas, numero_de_membros, esferico
+        )
+        deslocamento = caixinha.calcula_deslocamento_quadrado_entre_grupos(centroides, centroides_centralizados)
+        inicio_da_convergencia = time.perf_counter()
+        erro = erro_dos_agrupamentos.sum()
+        medidas = (deslocamento / variancia, operadores.calcula_variacao_relativa(erro_anterior, erro), np.inf)
+
+        if reparos_da_iteracao > 0:
+            medidas = (np.inf, np.inf, np.inf)
+        centroides, erro_anterior = centroides_centralizados, erro
+        convergiu = operadores.registra_criterios_de_parada(
+            iteracoes_por_criterio, iteracao, medidas, tolerancia, criterio_de_parada
+        )
+
+        if registro is not None:
+            instrumentacao.anota_rotulacao(
+                registro, iteracao, inicio_da_atualizacao - inicio_da_rotulacao,
+                time.perf_counter() - inicio_da_convergencia, erro, deslocamento, np.nan, numero_de_membros
+            )
+            registro[iteracao, instrumentacao.TEMPO_DE_ATUALIZACAO] = inicio_da_convergencia - inicio_da_atualizacao
+
+        if convergiu:
+            break
+        else:
+            iteracao += 1
+
+    return centroides, iteracoes_por_criterio, reparos
+
+
+# noinspection SpellCheckingInspection
+def roda_k_means_em_blocos(
+    dados, centroides, centroides_fixos, tolerancia=1e-4, numero_maximo_de_iteracoes=1000,
+    criterio_de_parada=operadores.DESLOCAMENTO, tamanho_do_bloco=TAMANHO_DO_BLOCO, esferico=False, registro=None
+):
+    if criterio_de_parada == operadores.ROTULOS:
+        raise ValueError("O ajuste em blocos não guarda os rótulos e não pode usá-los como critério.")
+
+    return roda_k_means_a_partir_das_somas(
+        lambda centroides_atuais: rotula_e_acumula_em_blocos(
+            dados, centroides_atuais, tamanho_do_bloco, conta_candidatos_a_reparo(centroides_atuais.shape[0])
+        ),
+        calcula_variancia_media_em_blocos(dados, tamanho_do_bloco), centroides, centroides_fixos, tolerancia,
+        numero_maximo_de_iteracoes, criterio_de_parada, esferico, registro
+    )
@@ -0,0 +1,209 @@
+import collections
+
+import numba as nb
+import numpy as np
+
+from . import caixinha
+from . import instrumentacao
+from . import operadores
+
+EstadoIncremental = collections.namedtuple(
+    "EstadoIncremental",
+    ["centroides", "rotulos", "limites_superiores", "limites_inferiores", "somas", "numero_de_membros"],
+)
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def inicializa_estado(dados, centroides):
+    rotulos, limites_superiores, limites_inferiores = operadores.inicializa_limites(dados, centroides)
+    somas, numero_de_membros = operadores.soma_por_rotulo(dados, rotulos, centroides.shape[0])
+    estado = EstadoIncremental(
+        centroides.copy(), rotulos, limites_superiores, limites_inferiores, somas, numero_de_membros
+    )
+
+    return estado
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def acumula_observacoes(dados, rotulos, somas, numero_de_membros, sinal):
+    for d in range(dados.shape[0]):
+        rotulo = rotulos[d]
+        numero_de_membros[rotulo] += sinal
+
+        for f in range(dados.shape[1]):
+            somas[rotulo, f] += sinal * dados[d, f]
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, parallel=True, cache=True)
+def reexamina_e_acumula(
+    dados, centroides, centroides_dos_limites, rotulos, limites_superiores, limites_inferiores, somas,
+    numero_de_membros
+):
+    (numero_de_observacoes, dimensionalidade), numero_de_centroides = dados.shape, centroides.shape[0]
+    deslocamentos, maior_deslocamento, segundo_maior_deslocamento, rotulo_do_maior_deslocamento = (
+        operadores.calcula_deslocamentos_dos_centroides(centroides, centroides_dos_limites)
+    )
+    metades_das_menores_distancias = caixinha.calcula_metade_da_menor_distancia_entre_centroides(centroides)
+    numero_de_partes, observacoes_por_parte = operadores.divide_em_partes(numero_de_observacoes)
+    variacoes_das_somas = np.zeros((numero_de_partes, numero_de_centroides, dimensionalidade))
+    variacoes_dos_membros = np.zeros((numero_de_partes, numero_de_centroides), dtype=np.int_)
+    rotulos_alterados = 0
+
+    for p in nb.prange(numero_de_partes):
+        for d in range(p * observacoes_por_parte, min((p + 1) * observacoes_por_parte, numero_de_observacoes)):
+            rotulo = rotulos[d]
+            novo_rotulo = operadores.reexamina_observacao(
+                d, dados, centroides, rotulos, limites_superiores, limites_inferiores, deslocamentos,
+                maior_deslocamento, segundo_maior_deslocamento, rotulo_do_maior_deslocamento,
+                metades_das_menores_distancias
+            )
+
+            if novo_rotulo != rotulo:
+                rotulos_alterados += 1
+                variacoes_dos_membros[p, rotulo] -= 1
+                variacoes_dos_membros[p, novo_rotulo] += 1
+
+                for f in range(dimensionalidade):
+                    variacoes_das_somas[p, rotulo, f] -= dados[d, f]
+                    variacoes_das_somas[p, novo_rotulo, f] += dados[d, f]
+
+    somas += variacoes_das_somas.sum(axis=0)
+    numero_de_membros += variacoes_dos_membros.sum(axis=0)
+
+    return rotulos_alterados
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def repara_e_acumula(
+    dados, centroides_fixos, rotulos, limites_superiores, limites_inferiores, somas, numero_de_membros
+):
+    rotulos_anteriores = rotulos.copy()
+    observacoes_movidas = operadores.repara_agrupamentos_vazios(
+        rotulos, limites_superiores, numero_de_membros, centroides_fixos
+    )
+
+    for d in observacoes_movidas:
+        limites_inferiores[d] = 0.0
+
+        for f in range(dados.shape[1]):
+            somas[rotulos_anteriores[d], f] -= dados[d, f]
+            somas[rotulos[d], f] += dados[d, f]
+
+    return observacoes_movidas.shape[0]
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def reajusta_k_means(
+    dados, centroides, centroides_fixos, estado, tolerancia=1e-4, numero_maximo_de_iteracoes=1000,
+    criterio_de_parada=operadores.DESLOCAMENTO, esferico=False, registro=None
+):
+    if criterio_de_parada == operadores.INERCIA:
+        raise ValueError("O reajuste não calcula a inércia a cada iteração e não pode usá-la como critério.")
+
+    numero_de_observacoes = dados.shape[0]
+    centroides_dos_limites, rotulos, limites_superiores, limites_inferiores, somas, numero_de_membros = estado
+    variancia = caixinha.calcula_variancia_media(dados, caixinha.calcula_normas_quadradas(dados))
+    iteracoes_por_criterio = np.full(3, -1, dtype=np.int_)
+    iteracao, reparos = 0, 0
+
+    while iteracao < numero_maximo_de_iteracoes:
+        if registro is not None:
+            inicio_da_rotulacao = instrumentacao.marca_tempo()
+
+        rotulos_alterados = reexamina_e_acumula(
+            dados, centroides, centroides_dos_limites, rotulos, limites_superiores, limites_inferiores, somas,
+            numero_de_membros
+        )
+        centroides_dos_limites = centroides
+        reparos_da_iteracao = repara_e_acumula(
+            dados, centroides_fixos, rotulos, limites_superiores, limites_inferiores, somas, numero_de_membros
+        )
+        reparos += reparos_da_iteracao
+
+        if registro is not None:
+            inicio_da_atualizacao = instrumentacao.marca_tempo()
+
+        centroides_centralizados = operadores.calcula_centroides_a_partir_das_somas(
+            centroides, centroides_fixos, somas, numero_de_membros, esferico
+        )
+        deslocamento = caixinha.calcula_deslocamento_quadrado_entre_grupos(centroides, centroides_centralizados)
+        centroides = centroides_centralizados
+
+        if registro is not None:
+            inicio_da_convergencia = instrumentacao.marca_tempo()
+            registro[iteracao, instrumentacao.TEMPO_DE_ATUALIZACAO] = inicio_da_convergencia - inicio_da_atualizacao
+
+        medidas = (deslocamento / variancia, np.inf, rotulos_alterados / numero_de_observacoes)
+
+        if reparos_da_iteracao > 0:
+            medidas = (np.inf, np.inf, np.inf)
+        convergiu = operadores.registra_criterios_de_parada(
+            iteracoes_por_criterio, iteracao, medidas, tolerancia, criterio_de_parada
+        )
+
+        if registro is not None:
+            instrumentacao.anota_rotulacao(
+                registro, iteracao, inicio_da_atualizacao - inicio_da_rotulacao,
+                instrumentacao.marca_tempo() - inicio_da_convergencia, np.nan, deslocamento, rotulos_alterados,
+                numero_de_membros
+            )
+
+        iteracao += 1
+
+        if convergiu:
+            break
+
+    resultado = operadores.calcula_resultado(dados, centroides, rotulos)
+    estado = EstadoIncremental(
+        centroides_dos_limites, rotulos, limites_superiores, limites_inferiores, somas, numero_de_membros
+    )
+
+    return operadores.ResultadoDoKMeans(
+        resultado.centroides, resultado.rotulos, resultado.distancias, resultado.erro_dos_agrupamentos,
+        resultado.numero_de_membros, iteracao, iteracoes_por_criterio, reparos
+    ), estado
+
+
+# noinspection SpellCheckingInspection
+def adiciona_observacoes(estado, dados):
+    rotulos, limites_superiores, limites_inferiores = operadores.inicializa_limites(dados, estado.centroides)
+
+    acumula_observacoes(dados, rotulos, estado.somas, estado.numero_de_membros, 1)
+
+    return estado._replace(
+        rotulos=np.concatenate((estado.rotulos, rotulos)),
+        limites_superiores=np.concatenate((estado.limites_superiores, limites_superiores)),
+        limites_inferiores=np.concatenate((estado.limites_inferiores, limites_inferiores)),
+    )
+
+
+# noinspection SpellCheckingInspection
+def remove_observacoes(estado, dados, indices):
+    acumula_observacoes(dados[indices], estado.rotulos[indices], estado.somas, estado.numero_de_membros, -1)
+
+    return estado._replace(
+        rotulos=np.delete(estado.rotulos, indices),
+        limites_superiores=np.delete(estado.limites_superiores, indices),
+        limites_inferiores=np.delete(estado.limites_inferiores, indices),
+    )
+
+
+# noinspection SpellCheckingInspection
+def substitui_observacoes(estado, dados, indices, novas_observacoes):
+    acumula_observacoes(dados[indices], estado.rotulos[indices], estado.somas, estado.numero_de_membros, -1)
+
+    dados[indices] = novas_observacoes
+    rotulos, limites_superiores, limites_inferiores = operadores.inicializa_limites(
+        novas_observacoes, estado.centroides
+    )
+    estado.rotulos[indices] = rotulos
+    estado.limites_superiores[indices], estado.limites_inferiores[indices] = limites_superiores, limites_inferiores
+
+    acumula_observacoes(novas_observacoes, rotulos, estado.somas, estado.numero_de_membros, 1)
+
+    return estado
@@ -0,0 +1,92 @@
+import time
+
+import numba as nb
+import numpy as np
+
+(
+    ITERACAO, TEMPO_DE_ROTULACAO, TEMPO_DE_ATUALIZACAO, TEMPO_DE_CONVERGENCIA, INERCIA, DESLOCAMENTO,
+    ROTULOS_ALTERADOS, AGRUPAMENTOS_VAZIOS, EXECUCOES_ATIVAS,
+) = range(9)
+
+CAMPOS = (
+    "iteracao", "tempo_de_rotulacao", "tempo_de_atualizacao", "tempo_de_convergencia", "inercia", "deslocamento",
+    "rotulos_alterados", "agrupamentos_vazios", "execucoes_ativas",
+)
+
+TEMPOS = ("tempo_de_rotulacao", "tempo_de_atualizacao", "tempo_de_convergencia")
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def marca_tempo():
+    with nb.objmode(instante="float64"):
+        instante = time.perf_counter()
+
+    return instante
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def anota_rotulacao(
+    registro, iteracao, tempo_de_rotulacao, tempo_de_convergencia, inercia, deslocamento, rotulos_alterados,
+    numero_de_membros
+):
+    registro[iteracao, ITERACAO] = iteracao
+    registro[iteracao, TEMPO_DE_ROTULACAO] = tempo_de_rotulacao
+    registro[iteracao, TEMPO_DE_CONVERGENCIA] = tempo_de_convergencia
+    registro[iteracao, INERCIA] = inercia
+    registro[iteracao, DESLOCAMENTO] = deslocamento
+    registro[iteracao, ROTULOS_ALTERADOS] = rotulos_alterados
+    registro[iteracao, AGRUPAMENTOS_VAZIOS] = (numero_de_membros == 0).sum()
+
+
+# noinspection SpellCheckingInspection
+def cria_registro(numero_maximo_de_iteracoes):
+    return np.full((numero_maximo_de_iteracoes + 1, len(CAMPOS)), np.nan)
+
+
+# noinspection SpellCheckingInspection
+class Registrador:
+    def __init__(self, *, ao_terminar_execucao=None):
+        self.ao_terminar_execucao = ao_terminar_execucao
+        self.iteracoes, self.execucoes = [], []
+
+    def registra_iteracoes(self, *, registro, **identificacao):
+        for linha in registro[~np.isnan(registro[:, ITERACAO])]:
+            self.iteracoes.append({**identificacao, **dict(zip(CAMPOS, linha.tolist()))})
+
+    def registra_execucao(self, *, registro, tempo_total, **totais):
+        resumo = {"execucao": len(self.execucoes), "tempo_total": tempo_total, **totais}
+
+        if registro is not None:
+            linhas = registro[~np.isnan(registro[:, ITERACAO])]
+            resumo["iteracoes"] = linhas.shape[0]
+            resumo.update({campo: np.nansum(linhas[:, CAMPOS.index(campo)]) for campo in TEMPOS})
+
+            self.registra_iteracoes(registro=registro, execucao=resumo["execucao"])
+
+        self.execucoes.append(resumo)
+
+        if self.ao_terminar_execucao is not None:
+            self.ao_terminar_execucao(resumo)
+
+    def registra_lote(self, *, registro, tempo_do_lote, erros, iteracoes, situacoes, reparos):
+        lote = 1 + max((linha.get("lote", -1) for linha in self.iteracoes), default=-1)
+
+        self.registra_iteracoes(registro=registro, lote=lote)
+
+        for erro, numero_de_iteracoes, situacao, numero_de_reparos in zip(erros, iteracoes, situacoes, reparos):
+            self.registra_execucao(
+                registro=None, tempo_total=None, tempo_do_lote=tempo_do_lote, lote=lote, erro=float(erro),
+                iteracoes=int(numero_de_iteracoes), situacao=int(situacao), reparos=int(numero_de_reparos)
+            )
+
+    def iteracoes_como_data_frame(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.iteracoes)
+
+    def execucoes_como_data_frame(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.execucoes)
@@ -1,17 +1,172 @@
+import os
+import time
 import typing as t
 
 import numpy as np
-import pandas as pd
 
+from . import caixinha
 from . import checagens
+from . import fora_da_memoria
+from . import incremental
+from . import instrumentacao
+from . import metricas
+from . import multiplas_execucoes
 from . import operadores
+from . import predicao
+from . import resultados as resultados_das_execucoes
 
 
 # noinspection SpellCheckingInspection
 class KMedias:
-    def __init__(self, *, numero_de_centroides):
+    INICIALIZACOES = ("aleatoria", "k-means++", "k-means||")
+    METRICAS = metricas.METRICAS
+    PRECISOES = {"dupla": np.float64, "simples": np.float32}
+    CRITERIOS_DE_PARADA = {
+        "deslocamento": operadores.DESLOCAMENTO, "inercia": operadores.INERCIA, "rotulos": operadores.ROTULOS
+    }
+
+    def __init__(
+        self, *, numero_de_centroides, acelerado=False, inicializacao="aleatoria", criterio_de_parada="deslocamento",
+        tolerancia=1e-4, numero_maximo_de_iteracoes=1000, metrica=metricas.EUCLIDIANA, precisao="dupla",
+        registrador=None
+    ):
         self.numero_de_centroides = numero_de_centroides
-        self.__centroides, self.__centroides_fixos, self.__dados = None, None, None
+        self.acelerado = acelerado
+        self.inicializacao = inicializacao
+        self.criterio_de_parada = criterio_de_parada
+        self.tolerancia = tolerancia
+        self.numero_maximo_de_iteracoes = numero_maximo_de_iteracoes
+        self.metrica = metrica
+        self.precisao = precisao
+        self.registrador = registrador
+        self.__centroides, self.__centroides_fixos, self.__dados, self.__origem = None, None, None, None
+        self.__numero_de_membros, self.__iteracoes_por_criterio, self.__resultado = None, None, None
+        self.__reparos = 0
+        self.__indice, self.__estado, self.__lote_pendente = None, None, None
+
+    @property
+    def acelerado(self):
+        return self.__acelerado
+
+    @acelerado.setter
+    def acelerado(self, novo_acelerado):
+        novo_acelerado = checagens.verifica_tipo(acelerado=(novo_acelerado, "atributo", bool))
+
+        self.__acelerado = novo_acelerado
+
+    @property
+    def inicializacao(self):
+        return self.__inicializacao
+
+    @inicializacao.setter
+    def inicializacao(self, nova_inicializacao):
+        nova_inicializacao = checagens.verifica_tipo(inicializacao=(nova_inicializacao, "atributo", str))
+
+        checagens.verifica_pertencimento(inicializacao=(nova_inicializacao, "atributo", self.INICIALIZACOES))
+
+        self.__inicializacao = nova_inicializacao
+
+    @property
+    def criterio_de_parada(self):
+        return self.__criterio_de_parada
+
+    @criterio_de_parada.setter
+    def criterio_de_parada(self, novo_criterio_de_parada):
+        novo_criterio_de_parada = checagens.verifica_tipo(
+            criterio_de_parada=(novo_criterio_de_parada, "atributo", str)
+        )
+
+        checagens.verifica_pertencimento(
+            criterio_de_parada=(novo_criterio_de_parada, "atributo", tuple(self.CRITERIOS_DE_PARADA.keys()))
+        )
+
+        self.__criterio_de_parada = novo_criterio_de_parada
+
+    @property
+    def tolerancia(self):
+        return self.__tolerancia
+
+    @tolerancia.setter
+    def tolerancia(self, nova_tolerancia):
+        nova_tolerancia = checagens.verifica_tipo(tolerancia=(nova_tolerancia, "atributo", t.SupportsFloat))
+
+        checagens.verifica_nao_negatividade(tolerancia=(nova_tolerancia, "atributo"))
+
+        self.__tolerancia = nova_tolerancia
+
+    @property
+    def numero_maximo_de_iteracoes(self):
+        return self.__numero_maximo_de_iteracoes
+
+    @numero_maximo_de_iteracoes.setter
+    def numero_maximo_de_iteracoes(self, novo_numero_maximo_de_iteracoes):
+        novo_numero_maximo_de_iteracoes = checagens.verifica_tipo(
+            numero_maximo_de_iteracoes=(novo_numero_maximo_de_iteracoes, "atributo", t.SupportsInt)
+        )
+
+        checagens.verifica_nao_negatividade(
+            numero_maximo_de_iteracoes=(novo_numero_maximo_de_iteracoes, "atributo")
+        )
+
+        self.__numero_maximo_de_iteracoes = novo_numero_maximo_de_iteracoes
+
+    @property
+    def metrica(self):
+        return self.__metrica
+
+    @metrica.setter
+    def metrica(self, nova_metrica):
+        nova_metrica = checagens.verifica_tipo(metrica=(nova_metrica, "atributo", str))
+
+        checagens.verifica_pertencimento(metrica=(nova_metrica, "atributo", self.METRICAS))
+
+        self.__metrica = nova_metrica
+
+    @property
+    def precisao(self):
+        return self.__precisao
+
+    @precisao.setter
+    def precisao(self, nova_precisao):
+        nova_precisao = checagens.verifica_tipo(precisao=(nova_precisao, "atributo", str))
+
+        checagens.verifica_pertencimento(precisao=(nova_precisao, "atributo", tuple(self.PRECISOES.keys())))
+
+        self.__precisao = nova_precisao
+
+    @property
+    def dtype(self):
+        if self.dados_em_disco:
+            return self.dados.dtype
+
+        # Na esfera as normas valem 1 e o cancelamento em float32 engoliria as cordas entre pontos próximos.
+        if self.esferico:
+            return np.dtype(np.float64)
+
+        return np.dtype(self.PRECISOES[self.precisao])
+
+    @property
+    def registrador(self):
+        return self.__registrador
+
+    @registrador.setter
+    def registrador(self, novo_registrador):
+        novo_registrador = checagens.verifica_tipo(
+            registrador=(novo_registrador, "atributo", (instrumentacao.Registrador, type(None)))
+        )
+
+        self.__registrador = novo_registrador
+
+    @property
+    def esferico(self):
+        return self.metrica == metricas.GEODESICA
+
+    @property
+    def iteracoes_por_criterio(self):
+        if self.__iteracoes_por_criterio is None:
+            return None
+
+        return dict(zip(self.CRITERIOS_DE_PARADA.keys(), self.__iteracoes_por_criterio))
 
     @property
     def numero_de_centroides(self):
@@ -29,36 +184,44 @@ class KMedias:
 
     @property
     def centroides(self):
-        return self.__centroides
+        if self.__centroides is None:
+            return None
+
+        return self._para_coordenadas(self.__centroides)
 
     @centroides.setter
     def centroides(self, novos_centroides):
-        if novos_centroides is None:
-            novos_centroides = operadores.gera_centroides(
-                dados=self.dados, numero_de_centroides=self.numero_de_centroides
-            )
-            self.centroides_fixos = novos_centroides.shape[0] * [False]
-        elif isinstance(novos_centroides, np.ndarray):
-            novos_centroides = checagens.verifica_tipo(centroides=(novos_centroides, "atributo", np.ndarray))
+        self._inicializa_centroides(self._prepara_centroides_fixos(novos_centroides))
 
-            checagens.verifica_ndim(centroides=(novos_centroides, "atributo", 2))
-            checagens.verifica_comprimento_menor_ou_igual_a(
-                centroides=(novos_centroides, "atributo"), dados=(self.dados, "atributo")
-            )
+    def _prepara_centroides_fixos(self, centroides_fixos):
+        if not isinstance(centroides_fixos, np.ndarray):
+            return centroides_fixos
 
+        checagens.verifica_ndim(centroides=(centroides_fixos, "atributo", 2))
+        checagens.verifica_comprimento_menor_ou_igual_a(
+            centroides=(centroides_fixos, "atributo"), dados=(self.dados, "atributo")
+        )
+
+        return self._para_espaco_de_trabalho(centroides_fixos)
+
+    def _inicializa_centroides(self, novos_centroides):
+        if novos_centroides is None:
+            novos_centroides = self.gera_centroides(numero_de_centroides=self.numero_de_centroides)
+            self.__centroides_fixos = np.zeros(novos_centroides.shape[0], dtype=np.bool_)
+        elif isinstance(novos_centroides, np.ndarray):
             centroides_faltantes = self.numero_de_centroides - novos_centroides.shape[0]
 
             if centroides_faltantes > 0:
-                centroides_complementares = operadores.gera_centroides(
-                    dados=self.dados, numero_de_centroides=centroides_faltantes
+                centroides_complementares = self.gera_centroides(
+                    numero_de_centroides=centroides_faltantes, centroides_iniciais=novos_centroides
                 )
-                self.centroides_fixos = novos_centroides.shape[0] * [True] + centroides_faltantes * [False]
+                self.__centroides_fixos = np.arange(self.numero_de_centroides) < novos_centroides.shape[0]
                 novos_centroides = np.concatenate((novos_centroides, centroides_complementares), axis=0)
             elif centroides_faltantes < 0:
                 novos_centroides = novos_centroides[:centroides_faltantes]
-                self.centroides_fixos = novos_centroides.shape[0] * [False]
+                self.__centroides_fixos = np.zeros(novos_centroides.shape[0], dtype=np.bool_)
 
-        self.__centroides = novos_centroides
+        self.__centroides, self.__resultado, self.__indice, self.__estado = novos_centroides, None, None, None
 
     @property
     def centroides_fixos(self):
@@ -84,39 +247,407 @@ class KMedias:
 
     @dados.setter
     def dados(self, novos_dados):
+        if isinstance(novos_dados, (str, os.PathLike)):
+            novos_dados = np.load(novos_dados, mmap_mode="r")
+
         novos_dados = checagens.verifica_tipo(dados=(novos_dados, "atributo", np.ndarray))
 
         checagens.verifica_ndim(dados=(novos_dados, "atributo", 2))
 
-        self.__dados = novos_dados
+        if self.__centroides is None:
+            self.__origem = self._calcula_origem(novos_dados)
+
+        if isinstance(novos_dados, np.memmap) and not self.esferico:
+            self.__dados, self.__resultado, self.__estado = novos_dados, None, None
+        else:
+            self.__dados = None
+            self.__dados, self.__resultado, self.__estado = self._para_espaco_de_trabalho(novos_dados), None, None
+
+    def _adota_espaco_de_trabalho(self, *, dados, origem):
+        self.__centroides, self.__dados, self.__origem = None, dados, origem
+        self.__resultado, self.__indice, self.__estado = None, None, None
+
+    @property
+    def _origem(self):
+        return self.__origem
+
+    def _calcula_origem(self, dados):
+        if self.esferico or isinstance(dados, np.memmap) or self.PRECISOES[self.precisao] == np.float64:
+            return None
+
+        return np.asarray(dados).mean(axis=0, dtype=np.float64)
+
+    def _para_espaco_de_trabalho(self, coordenadas):
+        vetores = metricas.projeta(coordenadas, self.metrica)
+
+        if self.__origem is not None:
+            vetores = vetores - self.__origem
+
+        return np.ascontiguousarray(vetores, dtype=self.dtype)
+
+    def _para_coordenadas(self, vetores):
+        if self.__origem is not None:
+            vetores = vetores + self.__origem
+
+        return metricas.desprojeta(vetores, self.metrica)
+
+    def _converte_resultado(self, resultado):
+        if self.__origem is not None:
+            resultado = resultado._replace(centroides=resultado.centroides + self.__origem)
+
+        return metricas.converte_resultado(resultado, self.metrica)
+
+    def gera_centroides(self, *, numero_de_centroides, centroides_iniciais=None):
+        if centroides_iniciais is None:
+            centroides_iniciais = np.empty((0, self.dados.shape[1]))
+
+        centroides_iniciais = np.ascontiguousarray(centroides_iniciais, dtype=self.dtype)
+
+        if self.inicializacao == "k-means++":
+            return operadores.gera_centroides_k_means_mais_mais(self.dados, numero_de_centroides, centroides_iniciais)
+        elif self.inicializacao == "k-means||":
+            return operadores.gera_centroides_k_means_paralelo(self.dados, numero_de_centroides, centroides_iniciais)
+
+        return operadores.gera_centroides(self.dados, numero_de_centroides)
+
+    @property
+    def dados_em_disco(self):
+        return isinstance(self.dados, np.memmap)
+
+    @property
+    def resultado(self):
+        if self.__resultado is None and self.dados is not None and self.__centroides is not None:
+            if self.dados_em_disco:
+                resultado = fora_da_memoria.calcula_resultado_da_solucao_em_blocos(self.dados, self.__centroides)
+            else:
+                resultado = operadores.calcula_resultado_da_solucao(
+                    self.dados, self.__centroides, caixinha.calcula_normas_quadradas(self.dados)
+                )
+
+            self.__resultado = self._converte_resultado(resultado)
+
+        return self.__resultado
+
+    @property
+    def indice(self):
+        if self.__indice is None and self.__centroides is not None:
+            self.__indice = predicao.IndiceDeCentroides(centroides=self.__centroides)
+
+        return self.__indice
 
     @property
     def rotulos(self):
-        return operadores.rotula_dados(dados=self.dados, centroides=self.centroides)
+        return self.resultado.rotulos
 
-    def clusteriza_dados(self, *, dados, centroides_fixos, numero_de_execucoes=1000):
-        melhor_solucao, erro_da_melhor_solucao = None, None
-        data_frame = pd.DataFrame(index=range(numero_de_execucoes), columns=["Solução", "Erro"])
+    @property
+    def erro(self):
+        # Em disco, o erro é acumulado bloco a bloco sem montar os rótulos e as distâncias de todas as observações.
+        if self.dados_em_disco and self.__resultado is None and self.__centroides is not None:
+            erro_da_solucao = fora_da_memoria.calcula_erro_da_solucao_em_blocos(self.dados, self.__centroides)
 
-        for iteracao in range(numero_de_execucoes):
-            print(f"Execução {iteracao}...", end="\r")
+            return metricas.converte_erros(erro_da_solucao, self.metrica)
 
-            solucao = self._clusteriza_dados(dados=dados, centroides_fixos=centroides_fixos)
-            erro_da_solucao = operadores.calcula_erro_da_solucao(dados, solucao)
+        if (self.resultado.numero_de_membros == 0).any():
+            return np.inf
 
-            data_frame.iloc[iteracao, :] = np.array([solucao, erro_da_solucao], dtype=object)
+        return self.resultado.erro_dos_agrupamentos.sum()
 
-            if melhor_solucao is None or erro_da_solucao < erro_da_melhor_solucao:
-                melhor_solucao, erro_da_melhor_solucao = solucao, erro_da_solucao
+    def clusteriza_dados(
+        self, *, dados, centroides_fixos, numero_de_execucoes=1000, em_lote=True, numero_de_melhores=None
+    ):
+        self.__centroides = None
+        self.dados = dados
+        centroides_fixos = self._prepara_centroides_fixos(centroides_fixos)
+        criterio_de_parada = self.CRITERIOS_DE_PARADA[self.criterio_de_parada]
+
+        # O motor em lote não usa os limites do modo acelerado nem guarda os rótulos pedidos pelo critério "rotulos".
+        if em_lote is True and not (self.dados_em_disco or self.acelerado or criterio_de_parada == operadores.ROTULOS):
+            return self._clusteriza_dados_em_lote(
+                centroides_fixos=centroides_fixos, numero_de_execucoes=numero_de_execucoes,
+                numero_de_melhores=numero_de_melhores
+            )
+
+        resultados = self._cria_resultados(
+            numero_de_execucoes=numero_de_execucoes, numero_de_melhores=numero_de_melhores
+        )
+
+        for _ in range(numero_de_execucoes):
+            solucao = self._executa_k_means(centroides_fixos=centroides_fixos)
+            iteracoes = self.__iteracoes_por_criterio[criterio_de_parada]
+            convergiu = iteracoes != -1
+
+            resultados.adiciona_execucao(
+                solucao=solucao, erro=self.erro, iteracoes=iteracoes if convergiu else self.numero_maximo_de_iteracoes,
+                situacao=multiplas_execucoes.CONVERGIDA if convergiu else multiplas_execucoes.INTERROMPIDA,
+                reparos=self.__reparos
+            )
+
+        return resultados
+
+    def _cria_resultados(self, *, numero_de_execucoes, numero_de_melhores):
+        return resultados_das_execucoes.ResultadosDasExecucoes(
+            numero_de_execucoes=numero_de_execucoes, numero_de_centroides=self.numero_de_centroides,
+            dimensionalidade=2 if self.esferico else self.dados.shape[1], numero_de_melhores=numero_de_melhores,
+            dtype=self.dtype
+        )
+
+    def gera_centroides_iniciais(self, *, centroides_fixos, numero_de_execucoes):
+        return self._gera_centroides_iniciais(
+            centroides_fixos=self._prepara_centroides_fixos(centroides_fixos), numero_de_execucoes=numero_de_execucoes
+        )
+
+    def _gera_centroides_iniciais(self, *, centroides_fixos, numero_de_execucoes):
+        centroides_iniciais = np.empty(
+            (numero_de_execucoes, self.numero_de_centroides, self.dados.shape[1]), dtype=self.dtype
+        )
+
+        for execucao in range(numero_de_execucoes):
+            self._inicializa_centroides(centroides_fixos)
+            centroides_iniciais[execucao] = self.__centroides
+
+        return centroides_iniciais
+
+    def _clusteriza_dados_em_lote(self, *, centroides_fixos, numero_de_execucoes, numero_de_melhores):
+        centroides_iniciais = self._gera_centroides_iniciais(
+            centroides_fixos=centroides_fixos, numero_de_execucoes=numero_de_execucoes
+        )
+
+        registro, inicio = self._cria_registro(), time.perf_counter()
+        indice_da_melhor, solucoes, erros, iteracoes, situacoes, iteracoes_por_criterio, reparos = (
+            multiplas_execucoes.roda_k_means_em_lote(
+                self.dados, centroides_iniciais, self.centroides_fixos, self.tolerancia,
+                self.numero_maximo_de_iteracoes, self.CRITERIOS_DE_PARADA[self.criterio_de_parada], self.esferico,
+                registro
+            )
+        )
+        self.__centroides, self.__resultado = solucoes[indice_da_melhor], None
+        self.__indice, self.__estado = None, None
+        self.__iteracoes_por_criterio = iteracoes_por_criterio[indice_da_melhor]
+
+        if self.registrador is not None:
+            self.registrador.registra_lote(
+                registro=registro, tempo_do_lote=time.perf_counter() - inicio,
+                erros=metricas.converte_erros(erros, self.metrica), iteracoes=iteracoes, situacoes=situacoes,
+                reparos=reparos
+            )
+
+        resultados = self._cria_resultados(
+            numero_de_execucoes=numero_de_execucoes, numero_de_melhores=numero_de_melhores
+        )
 
-        return data_frame.infer_objects()
+        return resultados.adiciona(
+            solucoes=self._para_coordenadas(solucoes), erros=metricas.converte_erros(erros, self.metrica),
+            iteracoes=iteracoes, situacoes=situacoes, reparos=reparos
+        )
 
     def _clusteriza_dados(self, *, dados, centroides_fixos):
+        self.__centroides = None
         self.dados = dados
-        self.centroides = centroides_fixos
 
-        self.centroides = operadores.roda_k_means(
-            dados=dados, centroides=self.centroides, centroides_fixos=self.centroides_fixos
+        return self._executa_k_means(centroides_fixos=self._prepara_centroides_fixos(centroides_fixos))
+
+    def _executa_k_means(self, *, centroides_fixos):
+        if self.dados_em_disco and (self.acelerado or self.precisao != "dupla"):
+            raise ValueError(
+                "Os dados em disco são percorridos em blocos de precisão dupla, sem os limites do modo acelerado."
+            )
+
+        self._inicializa_centroides(centroides_fixos)
+        self.__numero_de_membros = None
+        registro, inicio = self._cria_registro(), time.perf_counter()
+
+        if self.dados_em_disco:
+            self.__centroides, self.__iteracoes_por_criterio, self.__reparos = fora_da_memoria.roda_k_means_em_blocos(
+                self.dados, self.__centroides, self.centroides_fixos, self.tolerancia, self.numero_maximo_de_iteracoes,
+                self.CRITERIOS_DE_PARADA[self.criterio_de_parada], esferico=self.esferico, registro=registro
+            )
+            self.__resultado, self.__indice, self.__estado = None, None, None
+        else:
+            resultado = operadores.roda_k_means(
+                self.dados, self.__centroides, self.centroides_fixos, self.tolerancia, self.numero_maximo_de_iteracoes,
+                self.acelerado, self.CRITERIOS_DE_PARADA[self.criterio_de_parada], self.esferico, registro
+            )
+            self.__centroides, self.__indice, self.__estado = resultado.centroides, None, None
+            self.__resultado = self._converte_resultado(resultado)
+            self.__iteracoes_por_criterio, self.__reparos = resultado.iteracoes_por_criterio, resultado.reparos
+
+        if self.registrador is not None:
+            self.registrador.registra_execucao(
+                registro=registro, tempo_total=time.perf_counter() - inicio, erro=float(self.erro),
+                reparos=int(self.__reparos)
+            )
+
+        return self.centroides
+
+    def reajusta(self):
+        estado = self._prepara_estado_incremental()
+        registro, inicio = self._cria_registro(), time.perf_counter()
+        resultado, self.__estado = incremental.reajusta_k_means(
+            self.dados, self.__centroides, self.centroides_fixos, estado, self.tolerancia,
+            self.numero_maximo_de_iteracoes, self.CRITERIOS_DE_PARADA[self.criterio_de_parada], self.esferico, registro
         )
+        self.__centroides, self.__indice = resultado.centroides, None
+        self.__resultado = self._converte_resultado(resultado)
+        self.__iteracoes_por_criterio, self.__reparos = resultado.iteracoes_por_criterio, resultado.reparos
+
+        if self.registrador is not None:
+            self.registrador.registra_execucao(
+                registro=registro, tempo_total=time.perf_counter() - inicio, erro=float(self.erro),
+                reparos=int(self.__reparos)
+            )
 
         return self.centroides
+
+    def adiciona_observacoes(self, *, dados):
+        estado = self._prepara_estado_incremental()
+        observacoes = self._prepara_observacoes(dados)
+        self.__estado = incremental.adiciona_observacoes(estado, observacoes)
+        self.__dados = np.concatenate((self.dados, observacoes))
+
+        return self._centraliza_pelas_somas()
+
+    def remove_observacoes(self, *, indices):
+        estado = self._prepara_estado_incremental()
+        indices = self._prepara_indices(indices)
+        self.__estado = incremental.remove_observacoes(estado, self.dados, indices)
+        self.__dados = np.delete(self.dados, indices, axis=0)
+
+        return self._centraliza_pelas_somas()
+
+    def substitui_observacoes(self, *, indices, dados):
+        estado = self._prepara_estado_incremental()
+        indices, observacoes = self._prepara_indices(indices), self._prepara_observacoes(dados)
+
+        checagens.verifica_comprimento_igual_a(dados=(observacoes, "parâmetro"), indices=(indices, "parâmetro"))
+
+        self.__dados = self.dados.copy()
+        self.__estado = incremental.substitui_observacoes(estado, self.__dados, indices, observacoes)
+
+        return self._centraliza_pelas_somas()
+
+    def _prepara_estado_incremental(self):
+        if self.__centroides is None or self.dados is None:
+            raise ValueError("O modelo precisa ser ajustado antes de ser atualizado incrementalmente.")
+
+        if self.dados_em_disco:
+            raise ValueError("As atualizações incrementais exigem que os dados estejam em memória.")
+
+        if self.__estado is None:
+            self.__estado = incremental.inicializa_estado(self.dados, self.__centroides)
+
+        return self.__estado
+
+    def _prepara_indices(self, indices):
+        indices = np.asarray(indices, dtype=np.int_).ravel()
+
+        if indices.size > 0 and (indices.min() < -self.dados.shape[0] or indices.max() >= self.dados.shape[0]):
+            raise IndexError("Os índices das observações precisam estar dentro dos limites dos dados.")
+
+        return np.unique(indices % self.dados.shape[0])
+
+    def _centraliza_pelas_somas(self):
+        self.__centroides = operadores.calcula_centroides_a_partir_das_somas(
+            self.__centroides, self.centroides_fixos, self.__estado.somas, self.__estado.numero_de_membros,
+            self.esferico
+        )
+        self.__resultado, self.__indice = None, None
+
+        return self.centroides
+
+    def _cria_registro(self):
+        if self.registrador is None:
+            return None
+
+        return instrumentacao.cria_registro(self.numero_maximo_de_iteracoes)
+
+    def calcula_erro_da_solucao(self, centroides):
+        centroides = self._para_espaco_de_trabalho(centroides)
+
+        if self.dados_em_disco:
+            erro_da_solucao = fora_da_memoria.calcula_erro_da_solucao_em_blocos(self.dados, centroides)
+        else:
+            erro_da_solucao = operadores.calcula_erro_da_solucao(
+                self.dados, centroides, caixinha.calcula_normas_quadradas(self.dados)
+            )
+
+        return metricas.converte_erros(erro_da_solucao, self.metrica)
+
+    def clusteriza_em_lotes(self, *, lotes, centroides_fixos, numero_de_epocas=1):
+        numero_de_epocas = checagens.verifica_tipo(numero_de_epocas=(numero_de_epocas, "parâmetro", t.SupportsInt))
+
+        checagens.verifica_nao_negatividade(numero_de_epocas=(numero_de_epocas, "parâmetro"))
+
+        if numero_de_epocas > 1 and not callable(lotes) and iter(lotes) is lotes:
+            raise ValueError(
+                "Um iterador de lotes só pode ser percorrido uma vez. Para mais de uma época, passe uma função que "
+                "crie os lotes a cada chamada."
+            )
+
+        self.__centroides, self.__numero_de_membros, self.__lote_pendente = None, None, None
+
+        for epoca in range(numero_de_epocas):
+            lotes_da_epoca = lotes() if callable(lotes) else lotes
+
+            for lote in lotes_da_epoca:
+                self.ajusta_parcialmente(lote=lote, centroides_fixos=centroides_fixos)
+
+        if self.__lote_pendente is not None:
+            raise ValueError(
+                f"Os lotes somam {len(self.__lote_pendente)} observações, menos que os {self.numero_de_centroides} "
+                f"centroides pedidos."
+            )
+
+        return self.centroides
+
+    def ajusta_parcialmente(self, *, lote, centroides_fixos=None):
+        lote = np.asarray(lote)
+
+        if self.__centroides is None:
+            # Os centroides iniciais só são sorteados quando os lotes recebidos somam observações suficientes.
+            if self.__lote_pendente is not None:
+                lote = np.concatenate((self.__lote_pendente, lote))
+
+            if len(lote) < self.numero_de_centroides:
+                self.__lote_pendente = lote
+
+                return None
+
+            self.__lote_pendente = None
+
+        self.dados = lote
+
+        if self.__centroides is None:
+            self.centroides = centroides_fixos
+            self.__centroides = self.__centroides.copy()
+
+        if self.__numero_de_membros is None:
+            self.__numero_de_membros = np.zeros(self.numero_de_centroides, dtype=np.int_)
+
+        operadores.atualiza_centroides_com_lote(
+            self.dados, self.__centroides, self.centroides_fixos, self.__numero_de_membros, self.esferico
+        )
+        self.__resultado, self.__indice, self.__estado = None, None, None
+
+        return self.centroides
+
+    def prediz(self, *, dados):
+        observacoes = self._prepara_observacoes(dados)
+        rotulos, _ = self.indice.rotula(observacoes)
+
+        return rotulos[0] if np.ndim(dados) == 1 else rotulos
+
+    def transforma(self, *, dados):
+        observacoes = self._prepara_observacoes(dados)
+        distancias = metricas.converte_distancias(self.indice.calcula_distancias(observacoes), self.metrica)
+
+        return distancias[0] if np.ndim(dados) == 1 else distancias
+
+    def _prepara_observacoes(self, dados):
+        if self.__centroides is None:
+            raise ValueError("O modelo precisa ser ajustado antes de rotular novas observações.")
+
+        observacoes = np.atleast_2d(np.asarray(dados, dtype=np.float64))
+
+        checagens.verifica_ndim(dados=(observacoes, "parâmetro", 2))
+
+        return self._para_espaco_de_trabalho(observacoes)
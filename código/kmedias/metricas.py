@@ -0,0 +1,110 @@
+import numba as nb
+import numpy as np
+
+EUCLIDIANA, GEODESICA = "euclidiana", "geodesica"
+
+METRICAS = (EUCLIDIANA, GEODESICA)
+
+RAIO_DA_TERRA = 6371.0088
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, parallel=True, cache=True)
+def projeta_na_esfera(coordenadas):
+    numero_de_observacoes = coordenadas.shape[0]
+    vetores = np.empty((numero_de_observacoes, 3))
+
+    for o in nb.prange(numero_de_observacoes):
+        longitude, latitude = np.radians(coordenadas[o, 0]), np.radians(coordenadas[o, 1])
+        vetores[o, 0] = np.cos(latitude) * np.cos(longitude)
+        vetores[o, 1] = np.cos(latitude) * np.sin(longitude)
+        vetores[o, 2] = np.sin(latitude)
+
+    return vetores
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def projeta_de_volta(vetores):
+    numero_de_observacoes = vetores.shape[0]
+    coordenadas = np.empty((numero_de_observacoes, 2))
+
+    for o in range(numero_de_observacoes):
+        coordenadas[o, 0] = np.degrees(np.arctan2(vetores[o, 1], vetores[o, 0]))
+        coordenadas[o, 1] = np.degrees(np.arctan2(vetores[o, 2], np.hypot(vetores[o, 0], vetores[o, 1])))
+
+    return coordenadas
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def normaliza_centroides(centroides, centroides_fixos):
+    for c in range(centroides.shape[0]):
+        norma = np.sqrt((centroides[c, :] ** 2).sum())
+
+        if not centroides_fixos[c] and norma > 0.0:
+            centroides[c, :] /= norma
+
+    return centroides
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def converte_cordas_em_arcos(cordas):
+    arcos = np.empty(cordas.shape[0])
+
+    for o in range(cordas.shape[0]):
+        arcos[o] = 2.0 * np.arcsin(min(cordas[o] / 2.0, 1.0)) * RAIO_DA_TERRA
+
+    return arcos
+
+
+# noinspection SpellCheckingInspection
+def projeta(coordenadas, metrica):
+    if metrica == GEODESICA:
+        coordenadas = np.asarray(coordenadas, dtype=np.float64)
+
+        if coordenadas.ndim != 2 or coordenadas.shape[1] != 2:
+            raise ValueError("A métrica geodésica espera coordenadas com duas colunas: longitude e latitude.")
+
+        return projeta_na_esfera(np.ascontiguousarray(coordenadas))
+
+    return coordenadas
+
+
+# noinspection SpellCheckingInspection
+def desprojeta(vetores, metrica):
+    if metrica == GEODESICA:
+        coordenadas = projeta_de_volta(np.ascontiguousarray(vetores).reshape(-1, 3))
+
+        return coordenadas.reshape(vetores.shape[:-1] + (2,))
+
+    return vetores
+
+
+# noinspection SpellCheckingInspection
+def converte_distancias(distancias, metrica):
+    if metrica == GEODESICA:
+        return converte_cordas_em_arcos(np.ascontiguousarray(distancias).ravel()).reshape(distancias.shape)
+
+    return distancias
+
+
+# noinspection SpellCheckingInspection
+def converte_erros(erros, metrica):
+    if metrica == GEODESICA:
+        return erros * RAIO_DA_TERRA ** 2
+
+    return erros
+
+
+# noinspection SpellCheckingInspection
+def converte_resultado(resultado, metrica):
+    if metrica == GEODESICA:
+        return resultado._replace(
+            centroides=projeta_de_volta(resultado.centroides),
+            distancias=converte_distancias(resultado.distancias, metrica),
+            erro_dos_agrupamentos=converte_erros(resultado.erro_dos_agrupamentos, metrica),
+        )
+
+    return resultado
@@ -0,0 +1,278 @@
+import numba as nb
+import numpy as np
+
+from . import caixinha
+from . import instrumentacao
+from . import operadores
+
+LIMITE_DE_DISTANCIAS_POR_BLOCO = 2 ** 18
+LIMITE_DE_VALORES_PARCIAIS = 2 ** 22
+
+ATIVA, CONVERGIDA, ABANDONADA, INTERROMPIDA = 0, 1, 2, 3
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, parallel=True, cache=True)
+def rotula_e_acumula_execucoes(dados, centroides, normas_dos_dados):
+    numero_de_observacoes, dimensionalidade = dados.shape
+    numero_de_execucoes, numero_de_centroides = centroides.shape[0], centroides.shape[1]
+    centroides_empilhados = centroides.reshape(numero_de_execucoes * numero_de_centroides, dimensionalidade)
+    normas_dos_centroides = caixinha.calcula_normas_quadradas(centroides_empilhados)
+    tamanho_do_bloco = max(
+        min(operadores.TAMANHO_DO_BLOCO, LIMITE_DE_DISTANCIAS_POR_BLOCO // centroides_empilhados.shape[0]), 1
+    )
+    numero_de_blocos = (numero_de_observacoes + tamanho_do_bloco - 1) // tamanho_do_bloco
+    # Cada parte guarda somas, contagens e erros de todas as execuções, então o número de partes também é limitado pela
+    # memória que essas cópias ocupam.
+    valores_por_parte = numero_de_execucoes * numero_de_centroides * (dimensionalidade + 2)
+    numero_de_partes = max(
+        min(operadores.NUMERO_MAXIMO_DE_PARTES, numero_de_blocos, LIMITE_DE_VALORES_PARCIAIS // valores_por_parte), 1
+    )
+    observacoes_por_parte = (numero_de_blocos + numero_de_partes - 1) // numero_de_partes * tamanho_do_bloco
+    formato_local = (numero_de_partes, numero_de_execucoes, numero_de_centroides)
+    somas_locais = np.zeros(formato_local + (dimensionalidade,))
+    numero_de_membros_locais = np.zeros(formato_local, dtype=np.int_)
+    erros_locais = np.zeros(formato_local)
+
+    for p in nb.prange(numero_de_partes):
+        fim_da_parte = min((p + 1) * observacoes_por_parte, numero_de_observacoes)
+
+        for inicio in range(p * observacoes_por_parte, fim_da_parte, tamanho_do_bloco):
+            fim = min(inicio + tamanho_do_bloco, fim_da_parte)
+            distancias = caixinha.calcula_distancia_entre_grupos(
+                dados[inicio:fim], centroides_empilhados, False, normas_dos_dados[inicio:fim], normas_dos_centroides
+            )
+
+            for d in range(fim - inicio):
+                for e in range(numero_de_execucoes):
+                    deslocamento = e * numero_de_centroides
+                    rotulo = distancias[d, deslocamento:deslocamento + numero_de_centroides].argmin()
+                    numero_de_membros_locais[p, e, rotulo] += 1
+                    erros_locais[p, e, rotulo] += distancias[d, deslocamento + rotulo]
+
+                    for f in range(dimensionalidade):
+                        somas_locais[p, e, rotulo, f] += dados[inicio + d, f]
+
+    somas = somas_locais.sum(axis=0)
+    numero_de_membros = numero_de_membros_locais.sum(axis=0)
+    erro_dos_agrupamentos = erros_locais.sum(axis=0)
+
+    return somas, numero_de_membros, erro_dos_agrupamentos
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def calcula_assinatura(centroides, centroides_fixos):
+    assinatura = np.inf
+
+    for c in range(centroides.shape[0]):
+        if not centroides_fixos[c]:
+            assinatura = min(assinatura, centroides[c, :].sum())
+
+    return assinatura
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def verifica_igualdade_entre_conjuntos(centroides_um, centroides_dois, centroides_fixos):
+    numero_de_centroides = centroides_um.shape[0]
+
+    for c_um in range(numero_de_centroides):
+        if centroides_fixos[c_um]:
+            continue
+
+        encontrado = False
+
+        for c_dois in range(numero_de_centroides):
+            if not centroides_fixos[c_dois] and (centroides_um[c_um, :] == centroides_dois[c_dois, :]).all():
+                encontrado = True
+                break
+
+        if not encontrado:
+            return False
+
+    return True
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def abandona_execucoes_repetidas(centroides, centroides_fixos, situacoes):
+    numero_de_execucoes = centroides.shape[0]
+    assinaturas = np.empty(numero_de_execucoes)
+
+    for e in range(numero_de_execucoes):
+        assinaturas[e] = calcula_assinatura(centroides[e], centroides_fixos)
+
+    ordem = np.argsort(assinaturas, kind="mergesort")
+
+    for i in range(numero_de_execucoes):
+        e = ordem[i]
+
+        if situacoes[e] != ATIVA:
+            continue
+
+        j = i - 1
+
+        while j >= 0 and assinaturas[ordem[j]] == assinaturas[e]:
+            outra = ordem[j]
+
+            if situacoes[outra] != ABANDONADA and verifica_igualdade_entre_conjuntos(
+                centroides[e], centroides[outra], centroides_fixos
+            ):
+                situacoes[e] = ABANDONADA
+                break
+
+            j -= 1
+
+        if situacoes[e] == ATIVA:
+            j = i + 1
+
+            while j < numero_de_execucoes and assinaturas[ordem[j]] == assinaturas[e]:
+                outra = ordem[j]
+
+                if situacoes[outra] == CONVERGIDA and verifica_igualdade_entre_conjuntos(
+                    centroides[e], centroides[outra], centroides_fixos
+                ):
+                    situacoes[e] = ABANDONADA
+                    break
+
+                j += 1
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, nogil=True, cache=True)
+def repara_agrupamentos_vazios_da_execucao(
+    dados, normas_dos_dados, centroides, centroides_fixos, somas, numero_de_membros, erro_dos_agrupamentos
+):
+    if not (np.logical_not(centroides_fixos) & (numero_de_membros == 0)).any():
+        return 0
+
+    rotulos, distancias, _, numero_de_membros_da_execucao, _ = operadores.rotula_e_acumula(
+        dados, centroides, normas_dos_dados
+    )
+    observacoes_movidas = operadores.repara_agrupamentos_vazios(
+        rotulos, distancias, numero_de_membros_da_execucao, centroides_fixos
+    )
+
+    if observacoes_movidas.shape[0] > 0:
+        somas_da_execucao, numero_de_membros_da_execucao = operadores.soma_por_rotulo(
+            dados, rotulos, centroides.shape[0]
+        )
+        somas[:] = somas_da_execucao
+        numero_de_membros[:] = numero_de_membros_da_execucao
+        erro_dos_agrupamentos[:] = np.bincount(
+            rotulos, weights=distancias.astype(np.float64), minlength=centroides.shape[0]
+        )
+
+    return observacoes_movidas.shape[0]
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, nogil=True, cache=True)
+def roda_k_means_em_lote(
+    dados, centroides_iniciais, centroides_fixos, tolerancia=1e-4, numero_maximo_de_iteracoes=1000,
+    criterio_de_parada=operadores.DESLOCAMENTO, esferico=False, registro=None
+):
+    return roda_k_means_em_lote_com_normas(
+        dados, caixinha.calcula_normas_quadradas(dados), centroides_iniciais, centroides_fixos, tolerancia,
+        numero_maximo_de_iteracoes, criterio_de_parada, esferico, registro
+    )
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, nogil=True, cache=True)
+def roda_k_means_em_lote_com_normas(
+    dados, normas_dos_dados, centroides_iniciais, centroides_fixos, tolerancia=1e-4, numero_maximo_de_iteracoes=1000,
+    criterio_de_parada=operadores.DESLOCAMENTO, esferico=False, registro=None
+):
+    if criterio_de_parada == operadores.ROTULOS:
+        raise ValueError("O motor de execuções em lote não guarda os rótulos e não pode usá-los como critério.")
+
+    numero_de_execucoes = centroides_iniciais.shape[0]
+    variancia = caixinha.calcula_variancia_media(dados, normas_dos_dados)
+    centroides = centroides_iniciais.copy()
+    situacoes = np.full(numero_de_execucoes, ATIVA, dtype=np.int8)
+    iteracoes = np.zeros(numero_de_execucoes, dtype=np.int_)
+    iteracoes_por_criterio = np.full((numero_de_execucoes, 3), -1, dtype=np.int_)
+    erros_anteriores = np.full(numero_de_execucoes, np.inf)
+    reparos = np.zeros(numero_de_execucoes, dtype=np.int_)
+    iteracao = 0
+
+    while iteracao < numero_maximo_de_iteracoes:
+        execucoes_ativas = np.where(situacoes == ATIVA)[0]
+
+        if execucoes_ativas.shape[0] == 0:
+            break
+
+        if registro is not None:
+            inicio_da_rotulacao = instrumentacao.marca_tempo()
+
+        centroides_ativos = centroides[execucoes_ativas]
+        somas, numero_de_membros, erro_dos_agrupamentos = rotula_e_acumula_execucoes(
+            dados, centroides_ativos, normas_dos_dados
+        )
+
+        if registro is not None:
+            inicio_da_atualizacao = instrumentacao.marca_tempo()
+
+        for a in range(execucoes_ativas.shape[0]):
+            e = execucoes_ativas[a]
+            reparos_da_execucao = repara_agrupamentos_vazios_da_execucao(
+                dados, normas_dos_dados, centroides_ativos[a], centroides_fixos, somas[a], numero_de_membros[a],
+                erro_dos_agrupamentos[a]
+            )
+            reparos[e] += reparos_da_execucao
+            centroides[e] = operadores.calcula_centroides_a_partir_das_somas(
+                centroides_ativos[a], centroides_fixos, somas[a], numero_de_membros[a], esferico
+            )
+            erro = erro_dos_agrupamentos[a].sum()
+            medidas = (
+                caixinha.calcula_deslocamento_quadrado_entre_grupos(centroides_ativos[a], centroides[e]) / variancia,
+                operadores.calcula_variacao_relativa(erros_anteriores[e], erro),
+                np.inf,
+            )
+            erros_anteriores[e] = erro
+
+            if reparos_da_execucao > 0:
+                medidas = (np.inf, np.inf, np.inf)
+
+            if operadores.registra_criterios_de_parada(
+                iteracoes_por_criterio[e], iteracao, medidas, tolerancia, criterio_de_parada
+            ):
+                situacoes[e] = CONVERGIDA
+            else:
+                iteracoes[e] += 1
+
+        if registro is not None:
+            inicio_da_convergencia = instrumentacao.marca_tempo()
+
+        abandona_execucoes_repetidas(centroides, centroides_fixos, situacoes)
+
+        if registro is not None:
+            instrumentacao.anota_rotulacao(
+                registro, iteracao, inicio_da_atualizacao - inicio_da_rotulacao,
+                instrumentacao.marca_tempo() - inicio_da_convergencia, erro_dos_agrupamentos.sum(), np.nan, np.nan,
+                numero_de_membros
+            )
+            registro[iteracao, instrumentacao.TEMPO_DE_ATUALIZACAO] = inicio_da_convergencia - inicio_da_atualizacao
+            registro[iteracao, instrumentacao.EXECUCOES_ATIVAS] = execucoes_ativas.shape[0]
+
+        iteracao += 1
+
+    for e in range(numero_de_execucoes):
+        if situacoes[e] == ATIVA:
+            situacoes[e] = INTERROMPIDA
+
+    _, numero_de_membros, erro_dos_agrupamentos = rotula_e_acumula_execucoes(dados, centroides, normas_dos_dados)
+    erros = np.empty(numero_de_execucoes)
+
+    for e in range(numero_de_execucoes):
+        erros[e] = np.inf if (numero_de_membros[e] == 0).any() else erro_dos_agrupamentos[e].sum()
+
+    indice_da_melhor = -1
+
+    for e in range(numero_de_execucoes):
+        if situacoes[e] != ABANDONADA and (indice_da_melhor == -1 or erros[e] < erros[indice_da_melhor]):
+            indice_da_melhor = e
+
+    return indice_da_melhor, centroides, erros, iteracoes, situacoes, iteracoes_por_criterio, reparos
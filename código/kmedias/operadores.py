@@ -1,26 +1,37 @@
+import collections
+
 import numba as nb
 import numpy as np
 
 from . import caixinha
+from . import instrumentacao
+from . import metricas
+
+TAMANHO_DO_BLOCO = 2048
+
+NUMERO_MAXIMO_DE_PARTES = 64
+
+DESLOCAMENTO, INERCIA, ROTULOS = 0, 1, 2
+
+ResultadoDoKMeans = collections.namedtuple(
+    "ResultadoDoKMeans",
+    [
+        "centroides", "rotulos", "distancias", "erro_dos_agrupamentos", "numero_de_membros", "iteracoes",
+        "iteracoes_por_criterio", "reparos",
+    ],
+)
 
 
 # noinspection SpellCheckingInspection
-@nb.jit(nopython=True, parallel=True)
-def calcula_erro_da_solucao(dados, centroides):
-    rotulos, numero_de_centroides = rotula_dados(dados, centroides), centroides.shape[0]
-    erro_dos_agrupamentos = np.empty(numero_de_centroides)
+@nb.jit(nopython=True, cache=True)
+def calcula_erro_da_solucao(dados, centroides, normas_dos_dados=None):
+    if normas_dos_dados is None:
+        normas_dos_dados = caixinha.calcula_normas_quadradas(dados)
 
-    for rotulo in nb.prange(numero_de_centroides):
-        membros_do_agrupamento = np.where(rotulos == rotulo)[0]
+    _, _, _, numero_de_membros, erro_dos_agrupamentos = rotula_e_acumula(dados, centroides, normas_dos_dados)
 
-        if membros_do_agrupamento.shape[0] == 0:
-            return np.inf
-        else:
-            centroide = centroides[rotulo, :].reshape(1, -1)
-            membros = dados[membros_do_agrupamento, :]
-            erro_dos_agrupamentos[rotulo] = caixinha.calcula_distancia_entre_grupos(
-                centroide, membros, tira_raiz=False
-            ).sum()
+    if (numero_de_membros == 0).any():
+        return np.inf
 
     erro_total = erro_dos_agrupamentos.sum()
 
@@ -28,63 +39,704 @@ def calcula_erro_da_solucao(dados, centroides):
 
 
 # noinspection SpellCheckingInspection
-@nb.jit(nopython=True, parallel=True)
-def centraliza_centroides(dados, centroides, centroides_fixos, rotulos):
+@nb.jit(nopython=True, cache=True)
+def calcula_centroides_a_partir_das_somas(centroides, centroides_fixos, somas, numero_de_membros, esferico=False):
     numero_de_centroides, dimensionalidade = centroides.shape
-    rotulos_unicos = np.arange(numero_de_centroides)[np.logical_not(centroides_fixos)]
-    numero_de_rotulos = rotulos_unicos.shape[0]
-    centroides_centralizados = np.empty((numero_de_centroides, dimensionalidade))
-    centroides_centralizados[centroides_fixos, :] = centroides[centroides_fixos, :]
+    centroides_centralizados = np.empty((numero_de_centroides, dimensionalidade), dtype=centroides.dtype)
+
+    for c in range(numero_de_centroides):
+        for f in range(dimensionalidade):
+            if centroides_fixos[c]:
+                centroides_centralizados[c, f] = centroides[c, f]
+            elif numero_de_membros[c] == 0:
+                centroides_centralizados[c, f] = np.nan
+            else:
+                centroides_centralizados[c, f] = somas[c, f] / numero_de_membros[c]
+
+    if esferico:
+        metricas.normaliza_centroides(centroides_centralizados, centroides_fixos)
+
+    return centroides_centralizados
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def repara_agrupamentos_vazios(rotulos, distancias, numero_de_membros, centroides_fixos):
+    observacoes_movidas = np.empty(numero_de_membros.shape[0], dtype=np.int_)
+    numero_de_reparos = 0
+
+    for c in range(numero_de_membros.shape[0]):
+        if centroides_fixos[c] or numero_de_membros[c] > 0:
+            continue
+
+        mais_distante = -1
 
-    for r in nb.prange(numero_de_rotulos):
-        rotulo = rotulos_unicos[r]
-        membros_do_agrupamento = np.where(rotulos == rotulo)[0]
-        agrupamento = dados[membros_do_agrupamento, :]
-        centroides_centralizados[rotulo, :] = caixinha.tira_media_das_colunas(agrupamento)
+        for d in range(rotulos.shape[0]):
+            if numero_de_membros[rotulos[d]] > 1 and (
+                mais_distante == -1 or distancias[d] > distancias[mais_distante]
+            ):
+                mais_distante = d
+
+        if mais_distante == -1:
+            break
+
+        numero_de_membros[rotulos[mais_distante]] -= 1
+        numero_de_membros[c] += 1
+        rotulos[mais_distante], distancias[mais_distante] = c, 0.0
+        observacoes_movidas[numero_de_reparos] = mais_distante
+        numero_de_reparos += 1
+
+    return observacoes_movidas[:numero_de_reparos]
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def centraliza_centroides(dados, centroides, centroides_fixos, rotulos, esferico=False):
+    somas, numero_de_membros = soma_por_rotulo(dados, rotulos, centroides.shape[0])
+    centroides_centralizados = calcula_centroides_a_partir_das_somas(
+        centroides, centroides_fixos, somas, numero_de_membros, esferico
+    )
 
     return centroides_centralizados
 
 
 # noinspection SpellCheckingInspection
-@nb.jit(nopython=True)
-def rotula_dados(dados, centroides):
-    distancias = caixinha.calcula_distancia_entre_grupos(dados, centroides)
+@nb.jit(nopython=True, cache=True)
+def divide_em_partes(numero_de_observacoes):
+    numero_de_blocos = (numero_de_observacoes + TAMANHO_DO_BLOCO - 1) // TAMANHO_DO_BLOCO
+    numero_de_partes = max(min(NUMERO_MAXIMO_DE_PARTES, numero_de_blocos), 1)
+    blocos_por_parte = (numero_de_blocos + numero_de_partes - 1) // numero_de_partes
+
+    return numero_de_partes, blocos_por_parte * TAMANHO_DO_BLOCO
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, parallel=True, cache=True)
+def rotula_e_acumula(dados, centroides, normas_dos_dados):
+    (numero_de_observacoes, dimensionalidade), numero_de_centroides = dados.shape, centroides.shape[0]
+    normas_dos_centroides = caixinha.calcula_normas_quadradas(centroides)
+    numero_de_partes, observacoes_por_parte = divide_em_partes(numero_de_observacoes)
+    rotulos = np.empty(numero_de_observacoes, dtype=np.int_)
+    distancias_minimas = np.empty(numero_de_observacoes, dtype=dados.dtype)
+    somas_locais = np.zeros((numero_de_partes, numero_de_centroides, dimensionalidade))
+    numero_de_membros_locais = np.zeros((numero_de_partes, numero_de_centroides), dtype=np.int_)
+    erros_locais = np.zeros((numero_de_partes, numero_de_centroides))
+
+    for p in nb.prange(numero_de_partes):
+        fim_da_parte = min((p + 1) * observacoes_por_parte, numero_de_observacoes)
+
+        for inicio in range(p * observacoes_por_parte, fim_da_parte, TAMANHO_DO_BLOCO):
+            fim = min(inicio + TAMANHO_DO_BLOCO, fim_da_parte)
+            distancias = caixinha.calcula_distancia_entre_grupos(
+                dados[inicio:fim], centroides, False, normas_dos_dados[inicio:fim], normas_dos_centroides
+            )
+
+            for d in range(fim - inicio):
+                rotulo = distancias[d].argmin()
+                rotulos[inicio + d], distancias_minimas[inicio + d] = rotulo, distancias[d, rotulo]
+                numero_de_membros_locais[p, rotulo] += 1
+                erros_locais[p, rotulo] += distancias[d, rotulo]
+
+                for f in range(dimensionalidade):
+                    somas_locais[p, rotulo, f] += dados[inicio + d, f]
+
+    somas = somas_locais.sum(axis=0)
+    numero_de_membros = numero_de_membros_locais.sum(axis=0)
+    erro_dos_agrupamentos = erros_locais.sum(axis=0)
+
+    return rotulos, distancias_minimas, somas, numero_de_membros, erro_dos_agrupamentos
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def rotula_dados(dados, centroides, normas_dos_dados=None):
+    if normas_dos_dados is None:
+        normas_dos_dados = caixinha.calcula_normas_quadradas(dados)
+
+    rotulos, _ = rotula_dados_e_calcula_distancias(dados, centroides, normas_dos_dados)
+
+    return rotulos
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def rotula_dados_e_calcula_distancias(dados, centroides, normas_dos_dados):
+    rotulos, distancias_minimas = rotula_dados_com_normas(
+        dados, centroides, normas_dos_dados, caixinha.calcula_normas_quadradas(centroides)
+    )
+
+    return rotulos, distancias_minimas
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, parallel=True, cache=True)
+def rotula_dados_com_normas(dados, centroides, normas_dos_dados, normas_dos_centroides):
     numero_de_observacoes = dados.shape[0]
+    numero_de_blocos = (numero_de_observacoes + TAMANHO_DO_BLOCO - 1) // TAMANHO_DO_BLOCO
     rotulos = np.empty(numero_de_observacoes, dtype=np.int_)
+    distancias_minimas = np.empty(numero_de_observacoes, dtype=dados.dtype)
 
-    for d in nb.prange(numero_de_observacoes):
+    for b in nb.prange(numero_de_blocos):
+        inicio = b * TAMANHO_DO_BLOCO
+        fim = min(inicio + TAMANHO_DO_BLOCO, numero_de_observacoes)
+        distancias = caixinha.calcula_distancia_entre_grupos(
+            dados[inicio:fim], centroides, False, normas_dos_dados[inicio:fim], normas_dos_centroides
+        )
+
+        for d in range(fim - inicio):
+            rotulo = distancias[d].argmin()
+            rotulos[inicio + d], distancias_minimas[inicio + d] = rotulo, distancias[d, rotulo]
+
+    return rotulos, distancias_minimas
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def rotula_bloco(bloco, centroides, normas_dos_centroides):
+    distancias = caixinha.calcula_distancia_entre_grupos(
+        bloco, centroides, False, (bloco.astype(np.float64) ** 2).sum(axis=1), normas_dos_centroides
+    )
+    rotulos = np.empty(bloco.shape[0], dtype=np.int_)
+    distancias_minimas = np.empty(bloco.shape[0], dtype=bloco.dtype)
+
+    for d in range(bloco.shape[0]):
         rotulos[d] = distancias[d].argmin()
+        distancias_minimas[d] = distancias[d, rotulos[d]]
 
-    return rotulos
+    return rotulos, distancias_minimas
 
 
 # noinspection SpellCheckingInspection
-@nb.jit(nopython=True)
+@nb.jit(nopython=True, parallel=True, cache=True)
+def calcula_distancias_aos_centroides(dados, centroides, normas_dos_centroides):
+    numero_de_observacoes = dados.shape[0]
+    numero_de_blocos = (numero_de_observacoes + TAMANHO_DO_BLOCO - 1) // TAMANHO_DO_BLOCO
+    normas_dos_dados = caixinha.calcula_normas_quadradas(dados)
+    distancias = np.empty((numero_de_observacoes, centroides.shape[0]), dtype=dados.dtype)
+
+    for b in nb.prange(numero_de_blocos):
+        inicio = b * TAMANHO_DO_BLOCO
+        fim = min(inicio + TAMANHO_DO_BLOCO, numero_de_observacoes)
+        distancias[inicio:fim] = caixinha.calcula_distancia_entre_grupos(
+            dados[inicio:fim], centroides, True, normas_dos_dados[inicio:fim], normas_dos_centroides
+        )
+
+    return distancias
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
 def gera_centroides(dados, numero_de_centroides):
     comprimento, dimensionalidade = dados.shape
-    indices = np.arange(comprimento, dtype=np.int_)
-    indices_aleatorios = np.random.choice(indices, size=numero_de_centroides, replace=False)
-    centroides = dados[indices_aleatorios].copy()
+    indices_aleatorios = sorteia_indices_distintos(comprimento, numero_de_centroides)
+    centroides = np.empty((numero_de_centroides, dimensionalidade), dtype=dados.dtype)
+
+    for c in range(numero_de_centroides):
+        centroides[c, :] = dados[indices_aleatorios[c], :]
 
     return centroides
 
 
 # noinspection SpellCheckingInspection
-@nb.jit(nopython=True)
-def roda_k_means(dados, centroides, centroides_fixos, casas_decimais=4, numero_maximo_de_iteracoes=1000):
-    iteracao = 0
+@nb.jit(nopython=True, cache=True)
+def sorteia_indices_distintos(comprimento, quantidade):
+    if quantidade > comprimento:
+        raise ValueError("Não há observações suficientes para sortear os índices pedidos.")
+
+    indices = np.empty(quantidade, dtype=np.int_)
+    sorteados = 0
+
+    while sorteados < quantidade:
+        indice = np.random.randint(0, comprimento)
+
+        if not (indices[:sorteados] == indice).any():
+            indices[sorteados] = indice
+            sorteados += 1
+
+    return indices
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, parallel=True, cache=True)
+def inicializa_limites(dados, centroides):
+    numero_de_observacoes, numero_de_centroides = dados.shape[0], centroides.shape[0]
+    rotulos = np.empty(numero_de_observacoes, dtype=np.int_)
+    limites_superiores = np.empty(numero_de_observacoes)
+    limites_inferiores = np.empty(numero_de_observacoes)
+
+    for d in nb.prange(numero_de_observacoes):
+        rotulos[d], limites_superiores[d], limites_inferiores[d] = encontra_dois_centroides_mais_proximos(
+            dados[d, :], centroides, numero_de_centroides
+        )
+
+    return rotulos, limites_superiores, limites_inferiores
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def encontra_dois_centroides_mais_proximos(observacao, centroides, numero_de_centroides):
+    rotulo, menor_distancia, segunda_menor_distancia = 0, np.inf, np.inf
+
+    for c in range(numero_de_centroides):
+        distancia = caixinha.calcula_distancia_quadrada_entre_observacoes(observacao, centroides[c, :])
+
+        if distancia < menor_distancia:
+            rotulo, menor_distancia, segunda_menor_distancia = c, distancia, menor_distancia
+        elif distancia < segunda_menor_distancia:
+            segunda_menor_distancia = distancia
+
+    return rotulo, np.sqrt(menor_distancia), np.sqrt(segunda_menor_distancia)
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, parallel=True, cache=True)
+def atualiza_rotulos_com_limites(
+    dados, centroides, centroides_anteriores, rotulos, limites_superiores, limites_inferiores
+):
+    deslocamentos, maior_deslocamento, segundo_maior_deslocamento, rotulo_do_maior_deslocamento = (
+        calcula_deslocamentos_dos_centroides(centroides, centroides_anteriores)
+    )
+    metades_das_menores_distancias = caixinha.calcula_metade_da_menor_distancia_entre_centroides(centroides)
+    rotulos_alterados = 0
+
+    for d in nb.prange(dados.shape[0]):
+        rotulo = rotulos[d]
+
+        if reexamina_observacao(
+            d, dados, centroides, rotulos, limites_superiores, limites_inferiores, deslocamentos, maior_deslocamento,
+            segundo_maior_deslocamento, rotulo_do_maior_deslocamento, metades_das_menores_distancias
+        ) != rotulo:
+            rotulos_alterados += 1
+
+    return rotulos_alterados
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def calcula_deslocamentos_dos_centroides(centroides, centroides_anteriores):
+    numero_de_centroides = centroides.shape[0]
+    deslocamentos = np.empty(numero_de_centroides)
+
+    for c in range(numero_de_centroides):
+        deslocamentos[c] = np.sqrt(
+            caixinha.calcula_distancia_quadrada_entre_observacoes(centroides[c, :], centroides_anteriores[c, :])
+        )
+
+    maior_deslocamento, segundo_maior_deslocamento, rotulo_do_maior_deslocamento = 0.0, 0.0, -1
+
+    for c in range(numero_de_centroides):
+        if deslocamentos[c] > maior_deslocamento:
+            segundo_maior_deslocamento = maior_deslocamento
+            maior_deslocamento, rotulo_do_maior_deslocamento = deslocamentos[c], c
+        elif deslocamentos[c] > segundo_maior_deslocamento:
+            segundo_maior_deslocamento = deslocamentos[c]
+
+    return deslocamentos, maior_deslocamento, segundo_maior_deslocamento, rotulo_do_maior_deslocamento
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def reexamina_observacao(
+    d, dados, centroides, rotulos, limites_superiores, limites_inferiores, deslocamentos, maior_deslocamento,
+    segundo_maior_deslocamento, rotulo_do_maior_deslocamento, metades_das_menores_distancias
+):
+    rotulo = rotulos[d]
+    limites_superiores[d] += deslocamentos[rotulo]
+
+    if rotulo == rotulo_do_maior_deslocamento:
+        limites_inferiores[d] -= segundo_maior_deslocamento
+    else:
+        limites_inferiores[d] -= maior_deslocamento
+
+    limite = max(metades_das_menores_distancias[rotulo], limites_inferiores[d])
+
+    if limites_superiores[d] > limite:
+        limites_superiores[d] = np.sqrt(
+            caixinha.calcula_distancia_quadrada_entre_observacoes(dados[d, :], centroides[rotulo, :])
+        )
+
+        if limites_superiores[d] > limite:
+            rotulos[d], limites_superiores[d], limites_inferiores[d] = encontra_dois_centroides_mais_proximos(
+                dados[d, :], centroides, centroides.shape[0]
+            )
+
+    return rotulos[d]
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def registra_criterios_de_parada(iteracoes_por_criterio, iteracao, medidas, tolerancia, criterio_de_parada):
+    for c in range(iteracoes_por_criterio.shape[0]):
+        if iteracoes_por_criterio[c] == -1 and medidas[c] <= tolerancia:
+            iteracoes_por_criterio[c] = iteracao + 1
+
+    return iteracoes_por_criterio[criterio_de_parada] != -1
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def calcula_variacao_relativa(valor_anterior, valor):
+    if valor_anterior == np.inf:
+        return np.inf
+
+    return abs(valor_anterior - valor) / max(abs(valor_anterior), np.finfo(np.float64).tiny)
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def roda_k_means(
+    dados, centroides, centroides_fixos, tolerancia=1e-4, numero_maximo_de_iteracoes=1000, acelerado=False,
+    criterio_de_parada=DESLOCAMENTO, esferico=False, registro=None
+):
+    if acelerado is True:
+        return roda_k_means_acelerado(
+            dados, centroides, centroides_fixos, tolerancia, numero_maximo_de_iteracoes, criterio_de_parada, esferico,
+            registro
+        )
+
+    numero_de_observacoes = dados.shape[0]
+    normas_dos_dados = caixinha.calcula_normas_quadradas(dados)
+    variancia = caixinha.calcula_variancia_media(dados, normas_dos_dados)
+    rotulos_anteriores, erro_anterior = np.full(numero_de_observacoes, -1, dtype=np.int_), np.inf
+    deslocamento = np.inf
+    iteracoes_por_criterio = np.full(3, -1, dtype=np.int_)
+    iteracao, reparos = 0, 0
+
+    while True:
+        if registro is not None:
+            inicio_da_rotulacao = instrumentacao.marca_tempo()
+
+        rotulos, distancias, somas, numero_de_membros, erro_dos_agrupamentos = rotula_e_acumula(
+            dados, centroides, normas_dos_dados
+        )
+
+        observacoes_movidas = np.empty(0, dtype=np.int_)
+
+        if iteracao < numero_maximo_de_iteracoes:
+            observacoes_movidas = repara_agrupamentos_vazios(rotulos, distancias, numero_de_membros, centroides_fixos)
+
+        if observacoes_movidas.shape[0] > 0:
+            somas, numero_de_membros = soma_por_rotulo(dados, rotulos, centroides.shape[0])
+            erro_dos_agrupamentos = np.bincount(
+                rotulos, weights=distancias.astype(np.float64), minlength=centroides.shape[0]
+            )
+            reparos += observacoes_movidas.shape[0]
+
+        if registro is not None:
+            inicio_da_convergencia = instrumentacao.marca_tempo()
+
+        erro = erro_dos_agrupamentos.sum()
+        rotulos_alterados = caixinha.conta_diferencas(rotulos_anteriores, rotulos)
+        medidas = (
+            deslocamento / variancia,
+            calcula_variacao_relativa(erro_anterior, erro),
+            rotulos_alterados / numero_de_observacoes,
+        )
+
+        if observacoes_movidas.shape[0] > 0:
+            medidas = (np.inf, np.inf, np.inf)
+        convergiu = registra_criterios_de_parada(
+            iteracoes_por_criterio, iteracao - 1, medidas, tolerancia, criterio_de_parada
+        )
+
+        if registro is not None:
+            fim_da_convergencia = instrumentacao.marca_tempo()
+            instrumentacao.anota_rotulacao(
+                registro, iteracao, inicio_da_convergencia - inicio_da_rotulacao,
+                fim_da_convergencia - inicio_da_convergencia, erro, deslocamento, rotulos_alterados, numero_de_membros
+            )
+
+        if convergiu or iteracao == numero_maximo_de_iteracoes:
+            break
+
+        centroides_centralizados = calcula_centroides_a_partir_das_somas(
+            centroides, centroides_fixos, somas, numero_de_membros, esferico
+        )
+        deslocamento = caixinha.calcula_deslocamento_quadrado_entre_grupos(centroides, centroides_centralizados)
+        centroides, rotulos_anteriores, erro_anterior = centroides_centralizados, rotulos, erro
+
+        if registro is not None:
+            registro[iteracao, instrumentacao.TEMPO_DE_ATUALIZACAO] = (
+                instrumentacao.marca_tempo() - fim_da_convergencia
+            )
+
+        iteracao += 1
+
+    resultado = ResultadoDoKMeans(
+        centroides, rotulos, np.sqrt(distancias), erro_dos_agrupamentos, numero_de_membros, iteracao,
+        iteracoes_por_criterio, reparos
+    )
+
+    return resultado
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def roda_k_means_acelerado(
+    dados, centroides, centroides_fixos, tolerancia=1e-4, numero_maximo_de_iteracoes=1000,
+    criterio_de_parada=DESLOCAMENTO, esferico=False, registro=None
+):
+    if criterio_de_parada == INERCIA:
+        raise ValueError("O modo acelerado não calcula a inércia a cada iteração e não pode usá-la como critério.")
+
+    numero_de_observacoes = dados.shape[0]
+    rotulos, limites_superiores, limites_inferiores = inicializa_limites(dados, centroides)
+    variancia = caixinha.calcula_variancia_media(dados, caixinha.calcula_normas_quadradas(dados))
+    iteracoes_por_criterio = np.full(3, -1, dtype=np.int_)
+    iteracao, reparos = 0, 0
 
     while iteracao < numero_maximo_de_iteracoes:
-        rotulos = rotula_dados(dados, centroides)
-        centroides_centralizados = centraliza_centroides(dados, centroides, centroides_fixos, rotulos)
-        ha_igualdade = caixinha.verifica_igualdade_aproximada_entre_grupos(
-            centroides, centroides_centralizados, casas_decimais
+        if registro is not None:
+            inicio_da_atualizacao = instrumentacao.marca_tempo()
+
+        observacoes_movidas = repara_agrupamentos_vazios(
+            rotulos, limites_superiores, np.bincount(rotulos, minlength=centroides.shape[0]), centroides_fixos
+        )
+        limites_inferiores[observacoes_movidas] = 0.0
+        reparos += observacoes_movidas.shape[0]
+        centroides_centralizados = centraliza_centroides(dados, centroides, centroides_fixos, rotulos, esferico)
+        deslocamento = caixinha.calcula_deslocamento_quadrado_entre_grupos(centroides, centroides_centralizados)
+        centroides_anteriores, centroides = centroides, centroides_centralizados
+
+        if registro is not None:
+            inicio_da_rotulacao = instrumentacao.marca_tempo()
+            registro[iteracao, instrumentacao.TEMPO_DE_ATUALIZACAO] = inicio_da_rotulacao - inicio_da_atualizacao
+
+        rotulos_alterados = atualiza_rotulos_com_limites(
+            dados, centroides, centroides_anteriores, rotulos, limites_superiores, limites_inferiores
+        )
+
+        if registro is not None:
+            inicio_da_convergencia = instrumentacao.marca_tempo()
+
+        medidas = (deslocamento / variancia, np.inf, rotulos_alterados / numero_de_observacoes)
+        convergiu = registra_criterios_de_parada(
+            iteracoes_por_criterio, iteracao, medidas, tolerancia, criterio_de_parada
         )
-        centroides = centroides_centralizados
 
-        if ha_igualdade is True:
+        if registro is not None:
+            instrumentacao.anota_rotulacao(
+                registro, iteracao, inicio_da_convergencia - inicio_da_rotulacao,
+                instrumentacao.marca_tempo() - inicio_da_convergencia, np.nan, deslocamento, rotulos_alterados,
+                np.bincount(rotulos, minlength=centroides.shape[0])
+            )
+
+        iteracao += 1
+
+        if convergiu:
             break
+
+    resultado = calcula_resultado(dados, centroides, rotulos)
+
+    return ResultadoDoKMeans(
+        resultado.centroides, resultado.rotulos, resultado.distancias, resultado.erro_dos_agrupamentos,
+        resultado.numero_de_membros, iteracao, iteracoes_por_criterio, reparos
+    )
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, parallel=True, cache=True)
+def soma_por_rotulo(dados, rotulos, numero_de_centroides):
+    numero_de_observacoes, dimensionalidade = dados.shape
+    numero_de_partes, observacoes_por_parte = divide_em_partes(numero_de_observacoes)
+    somas_locais = np.zeros((numero_de_partes, numero_de_centroides, dimensionalidade))
+    numero_de_membros_locais = np.zeros((numero_de_partes, numero_de_centroides), dtype=np.int_)
+
+    for p in nb.prange(numero_de_partes):
+        for d in range(p * observacoes_por_parte, min((p + 1) * observacoes_por_parte, numero_de_observacoes)):
+            rotulo = rotulos[d]
+            numero_de_membros_locais[p, rotulo] += 1
+
+            for f in range(dimensionalidade):
+                somas_locais[p, rotulo, f] += dados[d, f]
+
+    somas = somas_locais.sum(axis=0)
+    numero_de_membros = numero_de_membros_locais.sum(axis=0)
+
+    return somas, numero_de_membros
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def atualiza_centroides_com_lote(lote, centroides, centroides_fixos, numero_de_membros, esferico=False):
+    _, _, somas, numero_de_membros_do_lote, erro_dos_agrupamentos = rotula_e_acumula(
+        lote, centroides, caixinha.calcula_normas_quadradas(lote)
+    )
+    numero_de_centroides, dimensionalidade = centroides.shape
+
+    for c in range(numero_de_centroides):
+        if centroides_fixos[c] or numero_de_membros_do_lote[c] == 0:
+            continue
+
+        numero_de_membros[c] += numero_de_membros_do_lote[c]
+        taxa_de_aprendizado = numero_de_membros_do_lote[c] / numero_de_membros[c]
+
+        for f in range(dimensionalidade):
+            media_do_lote = somas[c, f] / numero_de_membros_do_lote[c]
+            centroides[c, f] += taxa_de_aprendizado * (media_do_lote - centroides[c, f])
+
+    if esferico:
+        metricas.normaliza_centroides(centroides, centroides_fixos)
+
+    erro_total = erro_dos_agrupamentos.sum()
+
+    return erro_total
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, parallel=True, cache=True)
+def atualiza_distancias_minimas(dados, centroide, distancias_minimas):
+    for d in nb.prange(dados.shape[0]):
+        distancia = caixinha.calcula_distancia_quadrada_entre_observacoes(dados[d, :], centroide)
+
+        if distancia < distancias_minimas[d]:
+            distancias_minimas[d] = distancia
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def calcula_distancias_minimas(dados, centroides):
+    distancias_minimas = np.full(dados.shape[0], np.inf)
+
+    for c in range(centroides.shape[0]):
+        atualiza_distancias_minimas(dados, centroides[c, :], distancias_minimas)
+
+    return distancias_minimas
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def sorteia_indice_ponderado(pesos):
+    acumulados = np.cumsum(pesos)
+
+    if acumulados[-1] <= 0.0:
+        return np.random.randint(0, pesos.shape[0])
+
+    indice = np.searchsorted(acumulados, np.random.random() * acumulados[-1], side="right")
+
+    return min(indice, pesos.shape[0] - 1)
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def seleciona_centroides_por_d2(dados, pesos, numero_de_centroides, centroides_iniciais):
+    dimensionalidade = dados.shape[1]
+    centroides = np.empty((numero_de_centroides, dimensionalidade), dtype=dados.dtype)
+    distancias_minimas = calcula_distancias_minimas(dados, centroides_iniciais)
+
+    for c in range(numero_de_centroides):
+        if c == 0 and centroides_iniciais.shape[0] == 0:
+            indice = sorteia_indice_ponderado(pesos)
         else:
-            iteracao += 1
+            indice = sorteia_indice_ponderado(pesos * distancias_minimas)
+
+        centroides[c, :] = dados[indice, :]
+        atualiza_distancias_minimas(dados, centroides[c, :], distancias_minimas)
+
+    return centroides
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def gera_centroides_k_means_mais_mais(dados, numero_de_centroides, centroides_iniciais):
+    pesos = np.ones(dados.shape[0])
+    centroides = seleciona_centroides_por_d2(dados, pesos, numero_de_centroides, centroides_iniciais)
+
+    return centroides
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, parallel=True, cache=True)
+def sobreamostra_candidatos(distancias_minimas, sorteios, fator_de_sobreamostragem):
+    numero_de_observacoes = distancias_minimas.shape[0]
+    custo_total = distancias_minimas.sum()
+    escolhidos = np.zeros(numero_de_observacoes, dtype=np.bool_)
+
+    for d in nb.prange(numero_de_observacoes):
+        probabilidade = fator_de_sobreamostragem * distancias_minimas[d] / custo_total if custo_total > 0.0 else 0.0
+        escolhidos[d] = sorteios[d] < probabilidade
+
+    return np.where(escolhidos)[0]
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def gera_centroides_k_means_paralelo(
+    dados, numero_de_centroides, centroides_iniciais, fator_de_sobreamostragem=0.0, numero_de_rodadas=5
+):
+    (numero_de_observacoes, dimensionalidade), numero_de_iniciais = dados.shape, centroides_iniciais.shape[0]
+
+    if fator_de_sobreamostragem <= 0.0:
+        fator_de_sobreamostragem = 2.0 * numero_de_centroides
+
+    candidatos = np.empty((numero_de_iniciais + 1, dimensionalidade), dtype=dados.dtype)
+    candidatos[:numero_de_iniciais, :] = centroides_iniciais
+
+    if numero_de_iniciais == 0:
+        candidatos[0, :] = dados[np.random.randint(0, numero_de_observacoes), :]
+    else:
+        candidatos = candidatos[:numero_de_iniciais]
+
+    distancias_minimas = calcula_distancias_minimas(dados, candidatos)
+
+    for _ in range(numero_de_rodadas):
+        # Os sorteios saem do gerador da thread principal para que a semente reproduza os candidatos.
+        sorteios = np.random.random(numero_de_observacoes)
+        indices = sobreamostra_candidatos(distancias_minimas, sorteios, fator_de_sobreamostragem)
+        novos_candidatos = np.empty((indices.shape[0], dimensionalidade), dtype=dados.dtype)
+
+        for i in range(indices.shape[0]):
+            novos_candidatos[i, :] = dados[indices[i], :]
+            atualiza_distancias_minimas(dados, novos_candidatos[i, :], distancias_minimas)
+
+        candidatos = np.concatenate((candidatos, novos_candidatos))
+
+    rotulos = rotula_dados(dados, candidatos)
+    pesos = np.bincount(rotulos, minlength=candidatos.shape[0]).astype(np.float64)
+    candidatos_livres, pesos_livres = candidatos[numero_de_iniciais:], pesos[numero_de_iniciais:]
+
+    if candidatos_livres.shape[0] < numero_de_centroides:
+        return gera_centroides_k_means_mais_mais(dados, numero_de_centroides, centroides_iniciais)
+
+    centroides = seleciona_centroides_por_d2(candidatos_livres, pesos_livres, numero_de_centroides, centroides_iniciais)
 
     return centroides
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def semeia_gerador(semente):
+    np.random.seed(semente)
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, parallel=True, cache=True)
+def calcula_resultado(dados, centroides, rotulos):
+    numero_de_observacoes, numero_de_centroides = dados.shape[0], centroides.shape[0]
+    distancias = np.empty(numero_de_observacoes)
+
+    for d in nb.prange(numero_de_observacoes):
+        distancias[d] = caixinha.calcula_distancia_quadrada_entre_observacoes(dados[d, :], centroides[rotulos[d], :])
+
+    numero_de_membros = np.bincount(rotulos, minlength=numero_de_centroides)
+    erro_dos_agrupamentos = np.bincount(rotulos, weights=distancias, minlength=numero_de_centroides)
+    resultado = ResultadoDoKMeans(
+        centroides, rotulos, np.sqrt(distancias).astype(dados.dtype), erro_dos_agrupamentos, numero_de_membros, 0,
+        np.full(3, -1, dtype=np.int_), 0
+    )
+
+    return resultado
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def calcula_resultado_da_solucao(dados, centroides, normas_dos_dados):
+    rotulos, distancias, _, numero_de_membros, erro_dos_agrupamentos = rotula_e_acumula(
+        dados, centroides, normas_dos_dados
+    )
+    resultado = ResultadoDoKMeans(
+        centroides, rotulos, np.sqrt(distancias), erro_dos_agrupamentos, numero_de_membros, 0,
+        np.full(3, -1, dtype=np.int_), 0
+    )
+
+    return resultado
@@ -0,0 +1,166 @@
+import concurrent.futures as cf
+import multiprocessing as mp
+import os
+import typing as t
+from multiprocessing import shared_memory
+
+import numba as nb
+import numpy as np
+
+from . import checagens
+from . import metricas
+from . import multiplas_execucoes
+from . import operadores
+from .kmedias import KMedias
+
+MODOS = ("processos", "threads")
+
+estado_do_trabalhador = {}
+
+
+# noinspection SpellCheckingInspection
+class ArrayCompartilhado:
+    def __init__(self, *, formato, dtype, nome=None):
+        self.formato, self.dtype = tuple(formato), np.dtype(dtype)
+        tamanho = max(int(np.prod(self.formato)) * self.dtype.itemsize, 1)
+
+        if nome is None:
+            self.memoria, self.dono = shared_memory.SharedMemory(create=True, size=tamanho), True
+        else:
+            self.memoria, self.dono = shared_memory.SharedMemory(name=nome), False
+
+        self.array = np.ndarray(self.formato, dtype=self.dtype, buffer=self.memoria.buf)
+
+    @property
+    def descricao(self):
+        return self.memoria.name, self.formato, self.dtype.str
+
+    @classmethod
+    def a_partir_da_descricao(cls, descricao):
+        nome, formato, dtype = descricao
+
+        return cls(formato=formato, dtype=dtype, nome=nome)
+
+    def fecha(self):
+        self.array = None
+        self.memoria.close()
+
+        if self.dono:
+            self.memoria.unlink()
+
+
+# noinspection SpellCheckingInspection
+def inicializa_trabalhador(descricoes, configuracao):
+    estado_do_trabalhador["arrays"] = {
+        chave: ArrayCompartilhado.a_partir_da_descricao(descricao) for chave, descricao in descricoes.items()
+    }
+    estado_do_trabalhador["configuracao"] = configuracao
+
+
+# noinspection SpellCheckingInspection
+def executa_tarefa_no_processo(inicio, fim, semente):
+    arrays = {chave: compartilhado.array for chave, compartilhado in estado_do_trabalhador["arrays"].items()}
+
+    return executa_tarefa(arrays, estado_do_trabalhador["configuracao"], inicio, fim, semente)
+
+
+# noinspection SpellCheckingInspection
+def executa_tarefa(arrays, configuracao, inicio, fim, semente):
+    operadores.semeia_gerador(semente)
+
+    k_medias = KMedias(numero_de_centroides=configuracao["numero_de_centroides"], **configuracao["parametros"])
+    k_medias._adota_espaco_de_trabalho(dados=arrays["dados"], origem=configuracao["origem"])
+    centroides_iniciais = k_medias._gera_centroides_iniciais(
+        centroides_fixos=configuracao["centroides_fixos"], numero_de_execucoes=fim - inicio
+    )
+
+    _, solucoes, erros, iteracoes, situacoes, _, reparos = multiplas_execucoes.roda_k_means_em_lote(
+        k_medias.dados, centroides_iniciais, k_medias.centroides_fixos, k_medias.tolerancia,
+        k_medias.numero_maximo_de_iteracoes, k_medias.CRITERIOS_DE_PARADA[k_medias.criterio_de_parada],
+        k_medias.esferico
+    )
+
+    resultados = k_medias._cria_resultados(
+        numero_de_execucoes=fim - inicio, numero_de_melhores=configuracao["numero_de_melhores"]
+    )
+
+    return resultados.adiciona(
+        solucoes=k_medias._para_coordenadas(solucoes), erros=metricas.converte_erros(erros, k_medias.metrica),
+        iteracoes=iteracoes, situacoes=situacoes, reparos=reparos
+    )
+
+
+# noinspection SpellCheckingInspection
+def divide_em_tarefas(numero_de_execucoes, execucoes_por_tarefa):
+    return [
+        (inicio, min(inicio + execucoes_por_tarefa, numero_de_execucoes))
+        for inicio in range(0, numero_de_execucoes, execucoes_por_tarefa)
+    ]
+
+
+# noinspection SpellCheckingInspection
+def clusteriza_em_paralelo(
+    *, dados, numero_de_centroides, centroides_fixos, numero_de_execucoes=1000, numero_de_trabalhadores=None,
+    execucoes_por_tarefa=None, modo="processos", semente=None, numero_de_melhores=None, **parametros
+):
+    dados = checagens.verifica_tipo(dados=(dados, "parâmetro", np.ndarray))
+    numero_de_execucoes = checagens.verifica_tipo(numero_de_execucoes=(numero_de_execucoes, "parâmetro", t.SupportsInt))
+
+    checagens.verifica_ndim(dados=(dados, "parâmetro", 2))
+    checagens.verifica_pertencimento(modo=(modo, "parâmetro", MODOS))
+
+    # A camada workqueue do numba não aceita núcleos paralelos chamados de várias threads ao mesmo tempo e derruba o
+    # processo quando isso acontece.
+    if modo == "threads" and nb.threading_layer() == "workqueue":
+        raise ValueError(
+            "O modo threads exige a camada de threads tbb ou omp do numba, mas a camada em uso é a workqueue. Instale "
+            "o pacote tbb ou use o modo processos."
+        )
+
+    numero_de_trabalhadores = numero_de_trabalhadores or os.cpu_count() or 1
+
+    if execucoes_por_tarefa is None:
+        execucoes_por_tarefa = max(-(-numero_de_execucoes // (4 * numero_de_trabalhadores)), 1)
+
+    tarefas = divide_em_tarefas(numero_de_execucoes, execucoes_por_tarefa)
+    sementes = np.random.SeedSequence(semente).generate_state(len(tarefas))
+    k_medias = KMedias(numero_de_centroides=numero_de_centroides, **parametros)
+    k_medias.dados = np.ascontiguousarray(dados, dtype=np.float64)
+    dados = k_medias.dados
+    configuracao = {
+        "numero_de_centroides": numero_de_centroides,
+        "centroides_fixos": k_medias._prepara_centroides_fixos(centroides_fixos), "origem": k_medias._origem,
+        "numero_de_melhores": numero_de_melhores, "parametros": parametros
+    }
+    resultados = k_medias._cria_resultados(
+        numero_de_execucoes=numero_de_execucoes, numero_de_melhores=numero_de_melhores
+    )
+
+    if modo == "threads":
+        with cf.ThreadPoolExecutor(max_workers=numero_de_trabalhadores) as executor:
+            futuros = [
+                executor.submit(executa_tarefa, {"dados": dados}, configuracao, inicio, fim, int(semente_da_tarefa))
+                for (inicio, fim), semente_da_tarefa in zip(tarefas, sementes)
+            ]
+
+            resultados.combina(*(futuro.result() for futuro in futuros))
+    else:
+        compartilhado = ArrayCompartilhado(formato=dados.shape, dtype=dados.dtype)
+        compartilhado.array[:] = dados
+
+        try:
+            # Um fork herdaria o estado das threads do numba já iniciadas no processo pai e travaria ao terminar.
+            with cf.ProcessPoolExecutor(
+                max_workers=numero_de_trabalhadores, mp_context=mp.get_context("spawn"),
+                initializer=inicializa_trabalhador, initargs=({"dados": compartilhado.descricao}, configuracao)
+            ) as executor:
+                futuros = [
+                    executor.submit(executa_tarefa_no_processo, inicio, fim, int(semente_da_tarefa))
+                    for (inicio, fim), semente_da_tarefa in zip(tarefas, sementes)
+                ]
+
+                resultados.combina(*(futuro.result() for futuro in futuros))
+        finally:
+            compartilhado.fecha()
+
+    return resultados
@@ -0,0 +1,52 @@
+import numpy as np
+
+from . import caixinha
+from . import operadores
+
+LIMITE_DE_CENTROIDES_PARA_ARVORE = 128
+
+LIMITE_DE_DIMENSOES_PARA_ARVORE = 16
+
+LIMITE_DE_DISTANCIAS_SEM_ARVORE = 2 ** 15
+
+
+# noinspection SpellCheckingInspection
+class IndiceDeCentroides:
+    def __init__(self, *, centroides):
+        self.centroides = np.ascontiguousarray(centroides)
+        self.normas_dos_centroides = caixinha.calcula_normas_quadradas(self.centroides)
+        numero_de_centroides, dimensionalidade = self.centroides.shape
+
+        if numero_de_centroides >= LIMITE_DE_CENTROIDES_PARA_ARVORE and (
+            dimensionalidade <= LIMITE_DE_DIMENSOES_PARA_ARVORE
+        ):
+            from scipy import spatial
+
+            self.arvore = spatial.cKDTree(self.centroides)
+        else:
+            self.arvore = None
+
+    def rotula(self, dados):
+        if self.arvore is not None and dados.shape[0] * self.centroides.shape[0] > LIMITE_DE_DISTANCIAS_SEM_ARVORE:
+            distancias, rotulos = self.arvore.query(dados, k=1)
+
+            return rotulos.astype(np.int_), distancias
+
+        if dados.shape[0] <= operadores.TAMANHO_DO_BLOCO:
+            rotulos, distancias = operadores.rotula_bloco(dados, self.centroides, self.normas_dos_centroides)
+        else:
+            rotulos, distancias = operadores.rotula_dados_com_normas(
+                dados, self.centroides, caixinha.calcula_normas_quadradas(dados), self.normas_dos_centroides
+            )
+
+        return rotulos, np.sqrt(distancias)
+
+    def calcula_distancias(self, dados):
+        if dados.shape[0] <= operadores.TAMANHO_DO_BLOCO:
+            normas_dos_dados = np.square(dados, dtype=np.float64).sum(axis=1)
+
+            return caixinha.calcula_distancia_entre_grupos(
+                dados, self.centroides, True, normas_dos_dados, self.normas_dos_centroides
+            )
+
+        return operadores.calcula_distancias_aos_centroides(dados, self.centroides, self.normas_dos_centroides)
@@ -0,0 +1,183 @@
+import os
+import typing as t
+
+import numpy as np
+
+from . import checagens
+
+CAMPOS = ("solucoes", "erros", "iteracoes", "situacoes", "reparos")
+
+
+# noinspection SpellCheckingInspection
+class ResultadosDasExecucoes:
+    def __init__(
+        self, *, numero_de_execucoes, numero_de_centroides, dimensionalidade, numero_de_melhores=None,
+        dtype=np.float64, diretorio=None
+    ):
+        numero_de_execucoes = checagens.verifica_tipo(
+            numero_de_execucoes=(numero_de_execucoes, "parâmetro", t.SupportsInt)
+        )
+
+        if numero_de_melhores is not None:
+            numero_de_melhores = checagens.verifica_tipo(
+                numero_de_melhores=(numero_de_melhores, "parâmetro", t.SupportsInt)
+            )
+
+            checagens.verifica_nao_negatividade(numero_de_melhores=(numero_de_melhores, "parâmetro"))
+
+        checagens.verifica_nao_negatividade(numero_de_execucoes=(numero_de_execucoes, "parâmetro"))
+
+        self.numero_de_melhores = numero_de_melhores
+        self.capacidade = numero_de_execucoes if numero_de_melhores is None else min(
+            numero_de_execucoes, numero_de_melhores
+        )
+        formatos = {
+            "solucoes": ((self.capacidade, numero_de_centroides, dimensionalidade), dtype),
+            "erros": ((self.capacidade,), np.float64),
+            "iteracoes": ((self.capacidade,), np.int_),
+            "situacoes": ((self.capacidade,), np.int8),
+            "reparos": ((self.capacidade,), np.int_),
+        }
+
+        if diretorio is None:
+            self.arrays = {campo: np.empty(formato, dtype=tipo) for campo, (formato, tipo) in formatos.items()}
+        else:
+            os.makedirs(diretorio, exist_ok=True)
+
+            self.arrays = {
+                campo: np.lib.format.open_memmap(
+                    os.path.join(diretorio, f"{campo}.npy"), mode="w+", dtype=tipo, shape=formato
+                ) for campo, (formato, tipo) in formatos.items()
+            }
+
+        self.arrays["erros"][:] = np.nan
+        self.tamanho, self.execucoes_registradas = 0, 0
+
+    @property
+    def solucoes(self):
+        return self.arrays["solucoes"][:self.tamanho]
+
+    @property
+    def erros(self):
+        return self.arrays["erros"][:self.tamanho]
+
+    @property
+    def iteracoes(self):
+        return self.arrays["iteracoes"][:self.tamanho]
+
+    @property
+    def situacoes(self):
+        return self.arrays["situacoes"][:self.tamanho]
+
+    @property
+    def reparos(self):
+        return self.arrays["reparos"][:self.tamanho]
+
+    @property
+    def indice_da_melhor(self):
+        if self.tamanho == 0:
+            return -1
+
+        return int(np.argmin(self.erros))
+
+    @property
+    def melhor_solucao(self):
+        return self.solucoes[self.indice_da_melhor] if self.tamanho > 0 else None
+
+    @property
+    def melhor_erro(self):
+        return float(self.erros[self.indice_da_melhor]) if self.tamanho > 0 else np.inf
+
+    def __len__(self):
+        return self.tamanho
+
+    def adiciona(self, *, solucoes, erros, iteracoes, situacoes, reparos):
+        novos = {
+            "solucoes": solucoes, "erros": erros, "iteracoes": iteracoes, "situacoes": situacoes, "reparos": reparos
+        }
+        numero_de_novas = len(erros)
+        self.execucoes_registradas += numero_de_novas
+
+        if self.tamanho + numero_de_novas <= self.capacidade:
+            for campo in CAMPOS:
+                self.arrays[campo][self.tamanho:self.tamanho + numero_de_novas] = novos[campo]
+
+            self.tamanho += numero_de_novas
+
+            return self
+
+        if self.numero_de_melhores is None:
+            raise ValueError(f"Os resultados comportam no máximo {self.capacidade} execuções.")
+
+        erros = np.concatenate((self.erros, np.asarray(erros, dtype=np.float64)))
+        selecionadas = np.sort(np.argsort(erros, kind="stable")[:self.capacidade])
+        antigas, novas = selecionadas[selecionadas < self.tamanho], selecionadas[selecionadas >= self.tamanho]
+
+        for campo in CAMPOS:
+            array = self.arrays[campo]
+            array[:antigas.shape[0]] = array[antigas]
+            array[antigas.shape[0]:selecionadas.shape[0]] = np.asarray(novos[campo])[novas - self.tamanho]
+
+        self.tamanho = selecionadas.shape[0]
+
+        return self
+
+    def adiciona_execucao(self, *, solucao, erro, iteracoes, situacao, reparos):
+        return self.adiciona(
+            solucoes=solucao[np.newaxis], erros=[erro], iteracoes=[iteracoes], situacoes=[situacao], reparos=[reparos]
+        )
+
+    def combina(self, *outros):
+        for outro in outros:
+            execucoes_registradas = self.execucoes_registradas
+
+            self.adiciona(**{campo: getattr(outro, campo) for campo in CAMPOS})
+
+            self.execucoes_registradas = execucoes_registradas + outro.execucoes_registradas
+
+        return self
+
+    def ordem(self):
+        return np.argsort(self.erros, kind="stable")
+
+    def como_data_frame(self, *, ordenado=False):
+        import pandas as pd
+
+        indices = self.ordem() if ordenado else np.arange(self.tamanho)
+        data_frame = pd.DataFrame(
+            {
+                "Solução": list(self.solucoes[indices]),
+                "Erro": self.erros[indices],
+                "Iterações": self.iteracoes[indices],
+                "Situação": self.situacoes[indices],
+                "Reparos": self.reparos[indices],
+            }
+        )
+
+        return data_frame
+
+    def salva(self, *, caminho):
+        np.savez(
+            caminho, execucoes_registradas=self.execucoes_registradas,
+            **{campo: getattr(self, campo) for campo in CAMPOS}
+        )
+
+    @classmethod
+    def carrega(cls, *, caminho, mmap_mode="r"):
+        if os.path.isdir(caminho):
+            arrays = {campo: np.load(os.path.join(caminho, f"{campo}.npy"), mmap_mode=mmap_mode) for campo in CAMPOS}
+            execucoes_registradas = None
+        else:
+            with np.load(caminho) as arquivo:
+                arrays = {campo: arquivo[campo] for campo in CAMPOS}
+                execucoes_registradas = int(arquivo["execucoes_registradas"])
+
+        resultados = cls.__new__(cls)
+        resultados.arrays, resultados.numero_de_melhores = arrays, None
+        resultados.capacidade = arrays["erros"].shape[0]
+        resultados.tamanho = int(np.count_nonzero(~np.isnan(arrays["erros"])))
+        resultados.execucoes_registradas = (
+            resultados.tamanho if execucoes_registradas is None else execucoes_registradas
+        )
+
+        return resultados
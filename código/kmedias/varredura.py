@@ -0,0 +1,169 @@
+import typing as t
+
+import numba as nb
+import numpy as np
+
+from . import caixinha
+from . import checagens
+from . import metricas
+from . import multiplas_execucoes
+from . import operadores
+from .kmedias import KMedias
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, cache=True)
+def encontra_observacoes_mais_distantes(rotulos, distancias, numero_de_centroides):
+    mais_distantes = np.full(numero_de_centroides, -1, dtype=np.int_)
+
+    for d in range(rotulos.shape[0]):
+        rotulo = rotulos[d]
+
+        if mais_distantes[rotulo] == -1 or distancias[d] > distancias[mais_distantes[rotulo]]:
+            mais_distantes[rotulo] = d
+
+    return mais_distantes
+
+
+# noinspection SpellCheckingInspection
+@nb.jit(nopython=True, parallel=True, cache=True)
+def calcula_silhueta(amostra, rotulos, numero_de_centroides, esferico=False):
+    tamanho_da_amostra = amostra.shape[0]
+    numero_de_membros = np.bincount(rotulos, minlength=numero_de_centroides)
+    silhuetas = np.zeros(tamanho_da_amostra)
+
+    for i in nb.prange(tamanho_da_amostra):
+        somas = np.zeros(numero_de_centroides)
+
+        for j in range(tamanho_da_amostra):
+            if i != j:
+                distancia = np.sqrt(caixinha.calcula_distancia_quadrada_entre_observacoes(amostra[i, :], amostra[j, :]))
+
+                if esferico:
+                    distancia = 2.0 * np.arcsin(min(distancia / 2.0, 1.0))
+
+                somas[rotulos[j]] += distancia
+
+        rotulo = rotulos[i]
+
+        if numero_de_membros[rotulo] < 2:
+            continue
+
+        coesao, separacao = somas[rotulo] / (numero_de_membros[rotulo] - 1), np.inf
+
+        for c in range(numero_de_centroides):
+            if c != rotulo and numero_de_membros[c] > 0:
+                separacao = min(separacao, somas[c] / numero_de_membros[c])
+
+        if separacao < np.inf and max(coesao, separacao) > 0.0:
+            silhuetas[i] = (separacao - coesao) / max(coesao, separacao)
+
+    return silhuetas.mean()
+
+
+# noinspection SpellCheckingInspection
+def divide_agrupamentos(dados, centroides, centroides_fixos, resultado, numero_de_divisoes):
+    mais_distantes = encontra_observacoes_mais_distantes(
+        resultado.rotulos, resultado.distancias, centroides.shape[0]
+    )
+    candidatos = np.where(resultado.numero_de_membros > 1)[0]
+    candidatos = candidatos[np.argsort(-resultado.erro_dos_agrupamentos[candidatos], kind="stable")]
+
+    if candidatos.shape[0] == 0:
+        raise ValueError("Nenhum agrupamento tem observações suficientes para ser dividido.")
+
+    centroides_iniciais = np.empty(
+        (min(numero_de_divisoes, candidatos.shape[0]), centroides.shape[0] + 1, centroides.shape[1]),
+        dtype=centroides.dtype
+    )
+
+    for execucao, candidato in enumerate(candidatos[:centroides_iniciais.shape[0]]):
+        meio_caminho = (dados[mais_distantes[candidato]] - centroides[candidato]) / 2.0
+        centroides_iniciais[execucao, :-1] = centroides
+        centroides_iniciais[execucao, -1] = centroides[candidato] + meio_caminho
+
+        if not centroides_fixos[candidato]:
+            centroides_iniciais[execucao, candidato] -= meio_caminho
+
+    return centroides_iniciais, np.append(centroides_fixos, False)
+
+
+# noinspection SpellCheckingInspection
+def encontra_cotovelo(numeros_de_centroides, erros):
+    numeros_de_centroides, erros = np.asarray(numeros_de_centroides, dtype=np.float64), np.asarray(erros)
+
+    if numeros_de_centroides.shape[0] < 3 or erros[0] == erros[-1]:
+        return int(numeros_de_centroides[0])
+
+    x = (numeros_de_centroides - numeros_de_centroides[0]) / (numeros_de_centroides[-1] - numeros_de_centroides[0])
+    y = (erros[0] - erros) / (erros[0] - erros[-1])
+
+    return int(numeros_de_centroides[np.argmax(y - x)])
+
+
+# noinspection SpellCheckingInspection
+def varre_numeros_de_centroides(
+    *, dados, numeros_de_centroides, centroides_fixos=None, numero_de_execucoes=10, tamanho_da_amostra=2000,
+    semente=None, **parametros
+):
+    import pandas as pd
+
+    numero_de_execucoes = checagens.verifica_tipo(numero_de_execucoes=(numero_de_execucoes, "parâmetro", t.SupportsInt))
+    tamanho_da_amostra = checagens.verifica_tipo(tamanho_da_amostra=(tamanho_da_amostra, "parâmetro", t.SupportsInt))
+
+    checagens.verifica_nao_negatividade(
+        numero_de_execucoes=(numero_de_execucoes, "parâmetro"), tamanho_da_amostra=(tamanho_da_amostra, "parâmetro")
+    )
+
+    numeros_de_centroides = sorted({int(numero_de_centroides) for numero_de_centroides in numeros_de_centroides})
+    gerador = np.random.default_rng(semente)
+
+    if semente is not None:
+        operadores.semeia_gerador(semente)
+        np.random.seed(semente)
+
+    k_medias = KMedias(numero_de_centroides=numeros_de_centroides[0], **parametros)
+    k_medias.dados = dados
+    dados, criterio_de_parada = k_medias.dados, KMedias.CRITERIOS_DE_PARADA[k_medias.criterio_de_parada]
+    normas_dos_dados = caixinha.calcula_normas_quadradas(dados)
+    indices_da_amostra = np.sort(
+        gerador.choice(dados.shape[0], min(tamanho_da_amostra, dados.shape[0]), replace=False)
+    )
+    amostra = np.ascontiguousarray(dados[indices_da_amostra])
+    centroides_iniciais = k_medias.gera_centroides_iniciais(
+        centroides_fixos=centroides_fixos, numero_de_execucoes=numero_de_execucoes
+    )
+    mascara_dos_fixos, linhas = k_medias.centroides_fixos, []
+
+    for numero_de_centroides in range(numeros_de_centroides[0], numeros_de_centroides[-1] + 1):
+        if numero_de_centroides > numeros_de_centroides[0]:
+            centroides_iniciais, mascara_dos_fixos = divide_agrupamentos(
+                dados, centroides, mascara_dos_fixos, resultado, numero_de_execucoes
+            )
+
+        indice_da_melhor, solucoes, _, iteracoes, _, _, _ = multiplas_execucoes.roda_k_means_em_lote_com_normas(
+            dados, normas_dos_dados, centroides_iniciais, mascara_dos_fixos, k_medias.tolerancia,
+            k_medias.numero_maximo_de_iteracoes, criterio_de_parada, k_medias.esferico
+        )
+        centroides = solucoes[indice_da_melhor]
+        resultado = operadores.calcula_resultado_da_solucao(dados, centroides, normas_dos_dados)
+
+        if numero_de_centroides in numeros_de_centroides:
+            linhas.append(
+                {
+                    "Número de centroides": numero_de_centroides,
+                    "Solução": k_medias._para_coordenadas(centroides),
+                    "Erro": metricas.converte_erros(resultado.erro_dos_agrupamentos.sum(), k_medias.metrica),
+                    "Silhueta": calcula_silhueta(
+                        amostra, resultado.rotulos[indices_da_amostra], numero_de_centroides, k_medias.esferico
+                    ),
+                    "Iterações": iteracoes[indice_da_melhor],
+                }
+            )
+
+    data_frame = pd.DataFrame(linhas)
+    data_frame["Cotovelo"] = data_frame["Número de centroides"] == encontra_cotovelo(
+        data_frame["Número de centroides"], data_frame["Erro"]
+    )
+
+    return data_frame
@@ -1,44 +1,43 @@
 import numpy as np
-import pandas as pd
 import seaborn as sns
 from matplotlib import pyplot as plt
 
-from kmedias import KMedias, operadores
+from kmedias import KMedias, carregamento, operadores, paralelismo, resultados
 
 
 from dask import distributed
 
 
-# noinspection PyProtectedMember,SpellCheckingInspection
+# noinspection SpellCheckingInspection
 def clusteriza(*, dados, numero_de_centroides, centroides_fixos):
     k_medias = KMedias(numero_de_centroides=numero_de_centroides)
-    centroides = k_medias._clusteriza_dados(dados=dados, centroides_fixos=centroides_fixos)
-    erro = operadores.calcula_erro_da_solucao(dados, centroides)
 
-    return centroides, erro
+    return k_medias.clusteriza_dados(
+        dados=dados, centroides_fixos=centroides_fixos, numero_de_execucoes=1, em_lote=False
+    )
 
 
 # noinspection SpellCheckingInspection
-def clusteriza_em_paralelo(*, dados, numero_de_centroides, centroides_fixos, cliente, numero_de_execucoes):
-    solucoes = pd.DataFrame(index=range(numero_de_execucoes), columns=["Solução", "Erro"])
+def clusteriza_em_paralelo(
+    *, dados, numero_de_centroides, centroides_fixos, cliente, numero_de_execucoes, numero_de_melhores=None
+):
+    solucoes = resultados.ResultadosDasExecucoes(
+        numero_de_execucoes=numero_de_execucoes, numero_de_centroides=numero_de_centroides,
+        dimensionalidade=dados.shape[1], numero_de_melhores=numero_de_melhores
+    )
     futuros = [cliente.submit(
         clusteriza, dados=dados, numero_de_centroides=numero_de_centroides, centroides_fixos=centroides_fixos, pure=False
     ) for _ in range(numero_de_execucoes)]
 
     for futuro in distributed.as_completed(futuros):
-        indice_do_futuro = futuros.index(futuro)
-        solucoes.iloc[indice_do_futuro, :] = np.array(futuro.result(), dtype=object)
-
-    solucoes = solucoes.sort_values(by="Erro", ignore_index=True).infer_objects()
+        solucoes.combina(futuro.result())
 
     return solucoes
 
 
 # noinspection SpellCheckingInspection
-def gera_grafico_de_dispersao(*, dados, centroides=None):
-    if centroides is None:
-        rotulos = None
-    else:
+def gera_grafico_de_dispersao(*, dados, centroides=None, rotulos=None):
+    if rotulos is None and centroides is not None:
         rotulos = operadores.rotula_dados(dados=dados, centroides=centroides)
 
     figura, eixo = plt.subplots(1, 1, squeeze=True)
@@ -55,9 +54,14 @@ def gera_grafico_de_dispersao(*, dados, centroides=None):
 
 
 # noinspection PyTypeChecker,SpellCheckingInspection
-def gera_graficos_de_dispersao(*, dados, melhor_solucao, pior_solucao):
-    rotulos_da_melhor_solucao = operadores.rotula_dados(dados=dados, centroides=melhor_solucao)
-    rotulos_da_pior_solucao = operadores.rotula_dados(dados=dados, centroides=pior_solucao)
+def gera_graficos_de_dispersao(
+    *, dados, melhor_solucao, pior_solucao, rotulos_da_melhor_solucao=None, rotulos_da_pior_solucao=None
+):
+    if rotulos_da_melhor_solucao is None:
+        rotulos_da_melhor_solucao = operadores.rotula_dados(dados=dados, centroides=melhor_solucao)
+
+    if rotulos_da_pior_solucao is None:
+        rotulos_da_pior_solucao = operadores.rotula_dados(dados=dados, centroides=pior_solucao)
 
     figura, eixos = plt.subplots(1, 2, squeeze=True, sharey=True, figsize=(10, 5))
     figura.tight_layout()
@@ -91,27 +95,9 @@ def gera_graficos_de_dispersao(*, dados, melhor_solucao, pior_solucao):
 
 if __name__ == "__main__":
     # noinspection SpellCheckingInspection
-    cliente = distributed.Client(threads_per_worker=1)
-
-    # noinspection SpellCheckingInspection
-    aeroporto = pd.read_csv("../dados/coordenadas_aeroporto.csv", index_col=0)
+    aeroporto = carregamento.carrega_coordenadas("../dados/coordenadas_aeroporto.csv")
     # noinspection SpellCheckingInspection
-    bairros = pd.read_csv("../dados/coordenadas_bairros_final.csv", index_col=0)
-
-    for data_frame in [aeroporto, bairros]:
-        # noinspection SpellCheckingInspection
-        data_frame["Longitude"] = data_frame["Coordenadas"].apply(lambda x: x.split(", ")[1])
-        # noinspection SpellCheckingInspection
-        data_frame["Latitude"] = data_frame["Coordenadas"].apply(lambda x: x.split(", ")[0])
-
-        # noinspection SpellCheckingInspection
-        data_frame.drop("Coordenadas", axis=1, inplace=True)
-
-        data_frame["Longitude"] = pd.to_numeric(data_frame["Longitude"])
-        data_frame["Latitude"] = pd.to_numeric(data_frame["Latitude"])
-
-    # noinspection SpellCheckingInspection
-    aeroporto, bairros = aeroporto.to_numpy(), bairros.to_numpy()
+    bairros = carregamento.carrega_coordenadas("../dados/coordenadas_bairros_final.csv")
 
     # noinspection SpellCheckingInspection
     figura, eixo = gera_grafico_de_dispersao(dados=bairros, centroides=aeroporto)
@@ -119,16 +105,14 @@ if __name__ == "__main__":
     figura.show()
 
     # noinspection SpellCheckingInspection
-    solucoes = clusteriza_em_paralelo(
-        dados=bairros, numero_de_centroides=4, centroides_fixos=aeroporto, cliente=cliente, numero_de_execucoes=1000
+    solucoes = paralelismo.clusteriza_em_paralelo(
+        dados=bairros, numero_de_centroides=4, centroides_fixos=aeroporto, numero_de_execucoes=1000, metrica="geodesica"
     )
-
-    # noinspection SpellCheckingInspection
-    melhor_solucao, pior_solucao = solucoes.iloc[0, :], solucoes.iloc[-1, :]
+    ordem = solucoes.ordem()
 
     # noinspection SpellCheckingInspection
     figura, eixos = gera_graficos_de_dispersao(
-        dados=bairros, melhor_solucao=melhor_solucao[0], pior_solucao=pior_solucao[0]
+        dados=bairros, melhor_solucao=solucoes.solucoes[ordem[0]], pior_solucao=solucoes.solucoes[ordem[-1]]
     )
 
     figura.show()
@@ -0,0 +1,11 @@
+import numpy as np
+import pytest
+
+
+# noinspection SpellCheckingInspection
+@pytest.fixture
+def dados():
+    gerador = np.random.default_rng(0)
+    centros = np.array([[0.0, 0.0], [10.0, 0.0], [0.0, 10.0], [10.0, 10.0]])
+
+    return np.concatenate([centro + gerador.normal(size=(200, 2)) for centro in centros])
@@ -0,0 +1,13 @@
+import numpy as np
+
+from kmedias import caixinha
+
+
+# noinspection SpellCheckingInspection
+def test_distancias_entre_grupos_nao_ficam_negativas_nem_escondem_nan():
+    grupo_um = np.random.default_rng(0).uniform(1e3, 1e4, size=(200, 2))
+    grupo_dois = np.concatenate((grupo_um, [[np.nan, 0.0]]))
+    distancias = caixinha.calcula_distancia_entre_grupos(grupo_um, grupo_dois, False)
+
+    assert (distancias[:, :-1] >= 0.0).all()
+    assert np.isnan(distancias[:, -1]).all()
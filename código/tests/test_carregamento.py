@@ -0,0 +1,48 @@
+import os
+
+import numpy as np
+
+from kmedias import carregamento
+
+
+# noinspection SpellCheckingInspection
+def escreve_csv(caminho, coordenadas):
+    linhas = [f"\"{latitude}, {longitude}\"" for longitude, latitude in coordenadas]
+
+    with open(caminho, "w") as arquivo:
+        arquivo.write("\n".join(["Coordenadas"] + linhas) + "\n")
+
+
+# noinspection SpellCheckingInspection
+def test_cache_e_reaproveitado_e_invalidado(tmp_path):
+    caminho, coordenadas = tmp_path / "pontos.csv", np.array([[-46.6, -23.5], [-43.2, -22.9]])
+    escreve_csv(caminho, coordenadas)
+
+    carregadas = carregamento.carrega_coordenadas(caminho)
+    _, caminho_do_cache, _ = carregamento.caminhos_do_cache(caminho, None)
+    modificacao = os.stat(caminho_do_cache).st_mtime_ns
+
+    np.testing.assert_allclose(carregadas, coordenadas)
+    np.testing.assert_allclose(carregamento.carrega_coordenadas(caminho), coordenadas)
+    assert os.stat(caminho_do_cache).st_mtime_ns == modificacao
+
+    escreve_csv(caminho, coordenadas[::-1])
+
+    np.testing.assert_allclose(carregamento.carrega_coordenadas(caminho), coordenadas[::-1])
+
+
+# noinspection SpellCheckingInspection
+def test_leitura_em_pedacos(tmp_path):
+    caminho, coordenadas = tmp_path / "pontos.csv", np.random.default_rng(0).uniform(-50, 50, size=(25, 2))
+    escreve_csv(caminho, coordenadas)
+
+    np.testing.assert_allclose(carregamento.le_coordenadas(caminho, tamanho_do_pedaco=7), coordenadas)
+
+
+# noinspection SpellCheckingInspection
+def test_carrega_em_memoria_a_menos_que_o_mapeamento_seja_pedido(tmp_path):
+    caminho = tmp_path / "pontos.csv"
+    escreve_csv(caminho, np.array([[-46.6, -23.5], [-43.2, -22.9]]))
+
+    assert not isinstance(carregamento.carrega_coordenadas(caminho), np.memmap)
+    assert isinstance(carregamento.carrega_coordenadas(caminho, mapeia_na_memoria=True), np.memmap)
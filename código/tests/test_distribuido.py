@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from kmedias import caixinha
+from kmedias import distribuido
+from kmedias import fora_da_memoria
+from kmedias import metricas
+from kmedias import operadores
+
+distributed = pytest.importorskip("distributed")
+
+
+# noinspection SpellCheckingInspection
+@pytest.fixture(scope="module")
+def cliente():
+    with distributed.LocalCluster(n_workers=2, threads_per_worker=1, processes=False) as cluster:
+        with distributed.Client(cluster) as cliente:
+            yield cliente
+
+
+# noinspection SpellCheckingInspection
+def test_clusteriza_distribuido_encontra_os_agrupamentos(cliente, dados):
+    import dask.array as da
+
+    centroides_fixos = np.array([[5.0, 5.0]])
+
+    with distributed.get_task_stream(client=cliente) as tarefas:
+        centroides, erro, _ = distribuido.clusteriza_distribuido(
+            dados=da.from_array(dados, chunks=(150, 2)), numero_de_centroides=5, centroides_fixos=centroides_fixos,
+            semente=0, tolerancia=0.0
+        )
+
+    assert len(tarefas.data) > 0
+
+    np.testing.assert_array_equal(centroides[0], centroides_fixos[0])
+    np.testing.assert_allclose(erro, operadores.calcula_erro_da_solucao(dados, centroides))
+
+
+# noinspection SpellCheckingInspection
+def test_rotula_distribuido_equivale_a_rotulacao_em_memoria(cliente, dados):
+    import dask.array as da
+
+    centroides = dados[[0, 200, 400, 600]]
+    rotulos = distribuido.rotula_distribuido(dados=da.from_array(dados, chunks=(128, 2)), centroides=centroides)
+
+    np.testing.assert_array_equal(rotulos.compute(), operadores.rotula_dados(dados, centroides))
+
+
+# noinspection SpellCheckingInspection
+def test_acumulacao_distribuida_repara_agrupamentos_vazios_como_em_memoria(cliente, dados):
+    import dask
+
+    particoes = distribuido.particiona(dados, metricas.EUCLIDIANA).rechunk({0: 150}).to_delayed().ravel()
+    normas = [dask.delayed(caixinha.calcula_normas_quadradas)(particao) for particao in particoes]
+    centroides = np.concatenate((dados[[0, 200, 400, 600]], np.full((1, 2), 1e6)))
+    centroides_fixos = np.zeros(5, dtype=np.bool_)
+
+    centroides_distribuidos, _, reparos = fora_da_memoria.roda_k_means_a_partir_das_somas(
+        lambda centroides_atuais: distribuido.acumula_distribuido(particoes, normas, centroides_atuais), 1.0,
+        centroides.copy(), centroides_fixos, 0.0
+    )
+    resultado = operadores.roda_k_means(dados, centroides.copy(), centroides_fixos, 0.0)
+
+    assert reparos == resultado.reparos == 1
+    np.testing.assert_allclose(centroides_distribuidos, resultado.centroides)
@@ -0,0 +1,32 @@
+import numpy as np
+
+from kmedias import fora_da_memoria
+from kmedias import operadores
+
+
+# noinspection SpellCheckingInspection
+def test_rotulos_em_blocos_equivalem_aos_rotulos_em_memoria(dados, tmp_path):
+    caminho, centroides = tmp_path / "dados.npy", dados[[0, 200, 400, 600]]
+    np.save(caminho, dados)
+    rotulos = fora_da_memoria.rotula_dados_em_blocos(np.load(caminho, mmap_mode="r"), centroides, tamanho_do_bloco=96)
+
+    np.testing.assert_array_equal(rotulos, operadores.rotula_dados(dados, centroides))
+
+
+# noinspection SpellCheckingInspection
+def test_ajuste_em_blocos_repara_agrupamentos_vazios_como_em_memoria(dados, tmp_path):
+    caminho, centroides_fixos = tmp_path / "dados.npy", np.zeros(5, dtype=np.bool_)
+    centroides = np.concatenate((dados[[0, 200, 400, 600]], np.full((1, 2), 1e6)))
+    np.save(caminho, dados)
+
+    centroides_em_blocos, _, reparos = fora_da_memoria.roda_k_means_em_blocos(
+        np.load(caminho, mmap_mode="r"), centroides.copy(), centroides_fixos, 0.0, tamanho_do_bloco=96
+    )
+    resultado = operadores.roda_k_means(dados, centroides.copy(), centroides_fixos, 0.0)
+
+    assert reparos == resultado.reparos == 1
+    np.testing.assert_allclose(centroides_em_blocos, resultado.centroides)
+    np.testing.assert_allclose(
+        fora_da_memoria.calcula_erro_da_solucao_em_blocos(np.load(caminho, mmap_mode="r"), centroides_em_blocos),
+        resultado.erro_dos_agrupamentos.sum()
+    )
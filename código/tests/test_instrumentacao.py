@@ -0,0 +1,37 @@
+import numpy as np
+
+from kmedias import KMedias
+from kmedias import instrumentacao
+
+
+# noinspection SpellCheckingInspection
+def test_registrador_resume_cada_execucao_sequencial(dados):
+    resumos = []
+    registrador = instrumentacao.Registrador(ao_terminar_execucao=resumos.append)
+    k_medias = KMedias(numero_de_centroides=4, registrador=registrador)
+
+    resultados = k_medias.clusteriza_dados(dados=dados, centroides_fixos=None, numero_de_execucoes=3, em_lote=False)
+    execucoes, iteracoes = registrador.execucoes_como_data_frame(), registrador.iteracoes_como_data_frame()
+
+    assert resumos == registrador.execucoes
+    assert execucoes["execucao"].tolist() == [0, 1, 2]
+    np.testing.assert_allclose(np.sort(execucoes["erro"]), np.sort(resultados.erros))
+    assert (execucoes["tempo_total"] >= execucoes["tempo_de_rotulacao"]).all()
+    assert iteracoes.groupby("execucao").size().tolist() == execucoes["iteracoes"].tolist()
+    assert set(instrumentacao.CAMPOS) <= set(iteracoes.columns)
+
+
+# noinspection SpellCheckingInspection
+def test_registrador_separa_as_execucoes_de_cada_lote(dados):
+    registrador = instrumentacao.Registrador()
+    k_medias = KMedias(numero_de_centroides=4, registrador=registrador)
+
+    for _ in range(2):
+        k_medias.clusteriza_dados(dados=dados, centroides_fixos=None, numero_de_execucoes=5)
+
+    execucoes, iteracoes = registrador.execucoes_como_data_frame(), registrador.iteracoes_como_data_frame()
+
+    assert execucoes.groupby("lote").size().tolist() == [5, 5]
+    assert sorted(iteracoes["lote"].unique()) == [0, 1]
+    assert (iteracoes["execucoes_ativas"] <= 5).all()
+    assert np.isfinite(execucoes["erro"]).all()
@@ -0,0 +1,196 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from kmedias import KMedias
+from kmedias import operadores
+
+
+# noinspection SpellCheckingInspection
+def ajusta(k_medias, dados, centroides):
+    k_medias.dados = dados
+    k_medias.centroides = centroides
+    k_medias.centroides_fixos = np.zeros(centroides.shape[0], dtype=np.bool_)
+    centroides = k_medias._executa_k_means(centroides_fixos=k_medias._prepara_centroides_fixos(centroides))
+
+    return centroides, k_medias.rotulos.copy(), k_medias.erro
+
+
+# noinspection SpellCheckingInspection
+def test_limites_e_exato_chegam_a_mesma_solucao(dados):
+    centroides = dados[[0, 1, 2, 3, 4]]
+    exato = ajusta(KMedias(numero_de_centroides=5, tolerancia=0.0), dados, centroides)
+    acelerado = ajusta(KMedias(numero_de_centroides=5, acelerado=True, tolerancia=0.0), dados, centroides)
+
+    np.testing.assert_allclose(acelerado[0], exato[0])
+    np.testing.assert_array_equal(acelerado[1], exato[1])
+    np.testing.assert_allclose(acelerado[2], exato[2])
+
+
+# noinspection SpellCheckingInspection
+def test_reparo_preenche_agrupamentos_vazios(dados):
+    centroides = np.concatenate((dados[[0, 200, 400, 600]], np.full((3, 2), 1e6)))
+
+    for acelerado in (False, True):
+        k_medias = KMedias(numero_de_centroides=7, acelerado=acelerado)
+        ajusta(k_medias, dados, centroides)
+
+        assert k_medias.resultado.reparos == 3
+        assert (k_medias.resultado.numero_de_membros > 0).all()
+        assert np.isfinite(k_medias.centroides).all()
+
+
+# noinspection SpellCheckingInspection
+def test_precisao_simples_deslocada_chega_a_solucao_em_precisao_dupla(dados):
+    distantes, centroides = dados + 1e5, dados[[0, 200, 400, 600]] + 1e5
+    dupla = ajusta(KMedias(numero_de_centroides=4, tolerancia=0.0), distantes, centroides)
+    simples = ajusta(KMedias(numero_de_centroides=4, tolerancia=0.0, precisao="simples"), distantes, centroides)
+
+    np.testing.assert_allclose(simples[0], dupla[0], rtol=0.0, atol=1e-4)
+    np.testing.assert_array_equal(simples[1], dupla[1])
+    np.testing.assert_allclose(simples[2], dupla[2], rtol=1e-5)
+
+
+# noinspection SpellCheckingInspection
+def test_ajuste_em_lotes_segue_a_media_acumulada_sem_mover_os_fixos(dados):
+    observacoes, centroides_fixos = dados[600:], np.array([[-20.0, -20.0]])
+    k_medias = KMedias(numero_de_centroides=2)
+    centroides = k_medias.clusteriza_em_lotes(
+        lotes=[observacoes[:50], observacoes[50:120], observacoes[120:]], centroides_fixos=centroides_fixos
+    )
+
+    np.testing.assert_array_equal(centroides[0], centroides_fixos[0])
+    np.testing.assert_allclose(centroides[1], observacoes.mean(axis=0))
+
+
+# noinspection SpellCheckingInspection
+def test_ajuste_em_lotes_le_pedacos_do_pandas_menores_que_o_numero_de_centroides(dados, tmp_path):
+    caminho = tmp_path / "dados.csv"
+    pd.DataFrame(dados[600:], columns=["x", "y"]).to_csv(caminho, index=False)
+    k_medias = KMedias(numero_de_centroides=3)
+
+    centroides = k_medias.clusteriza_em_lotes(
+        lotes=lambda: pd.read_csv(caminho, chunksize=2), centroides_fixos=None, numero_de_epocas=2
+    )
+
+    assert centroides.shape == (3, 2)
+    assert np.isfinite(centroides).all()
+
+
+# noinspection SpellCheckingInspection
+def test_ajuste_em_lotes_recusa_iterador_em_mais_de_uma_epoca(dados):
+    with pytest.raises(ValueError):
+        KMedias(numero_de_centroides=2).clusteriza_em_lotes(
+            lotes=(dados[inicio:inicio + 100] for inicio in range(0, 800, 100)), centroides_fixos=None,
+            numero_de_epocas=2
+        )
+
+
+# noinspection SpellCheckingInspection
+def test_ajuste_em_disco_equivale_ao_ajuste_em_memoria(dados, tmp_path):
+    caminho, centroides = tmp_path / "dados.npy", dados[[0, 200, 400, 600]]
+    np.save(caminho, dados)
+    k_medias = KMedias(numero_de_centroides=4, tolerancia=0.0)
+
+    em_memoria = ajusta(k_medias, dados, centroides)
+    em_disco = ajusta(k_medias, np.load(caminho, mmap_mode="r"), centroides)
+
+    assert k_medias.dados_em_disco
+    np.testing.assert_allclose(em_disco[0], em_memoria[0])
+    np.testing.assert_array_equal(em_disco[1], em_memoria[1])
+    np.testing.assert_allclose(em_disco[2], em_memoria[2])
+
+
+# noinspection SpellCheckingInspection
+def test_erro_em_disco_nao_monta_o_resultado(dados, tmp_path):
+    caminho = tmp_path / "dados.npy"
+    np.save(caminho, dados)
+    k_medias = KMedias(numero_de_centroides=4, tolerancia=0.0)
+    k_medias.dados = np.load(caminho, mmap_mode="r")
+    k_medias.centroides = dados[[0, 200, 400, 600]]
+    k_medias._executa_k_means(centroides_fixos=k_medias._prepara_centroides_fixos(None))
+
+    erro = k_medias.erro
+
+    assert k_medias._KMedias__resultado is None
+    np.testing.assert_allclose(erro, operadores.calcula_erro_da_solucao(dados, k_medias.centroides))
+
+
+# noinspection SpellCheckingInspection
+@pytest.mark.parametrize("parametros", [{"acelerado": True}, {"precisao": "simples"}])
+def test_ajuste_em_disco_recusa_parametros_que_nao_suporta(dados, tmp_path, parametros):
+    caminho = tmp_path / "dados.npy"
+    np.save(caminho, dados)
+
+    with pytest.raises(ValueError):
+        KMedias(numero_de_centroides=4, **parametros).clusteriza_dados(
+            dados=np.load(caminho, mmap_mode="r"), centroides_fixos=None, numero_de_execucoes=1
+        )
+
+
+# noinspection SpellCheckingInspection
+@pytest.mark.parametrize("inicializacao", ["k-means++", "k-means||"])
+def test_sementes_partem_dos_centroides_fixos(dados, inicializacao):
+    operadores.semeia_gerador(0)
+    centroides_fixos = dados[[0, 200, 400]]
+    k_medias = KMedias(numero_de_centroides=4, inicializacao=inicializacao)
+    k_medias.dados = dados
+    centroides_iniciais = k_medias.gera_centroides_iniciais(centroides_fixos=centroides_fixos, numero_de_execucoes=20)
+    indices = [np.flatnonzero((dados == centroides[-1]).all(axis=1)) for centroides in centroides_iniciais]
+
+    np.testing.assert_array_equal(centroides_iniciais[:, :3], np.repeat(centroides_fixos[np.newaxis], 20, axis=0))
+    assert all(indice.shape[0] == 1 for indice in indices)
+    assert sum(indice[0] >= 600 for indice in indices) >= 15
+
+
+# noinspection SpellCheckingInspection
+def test_k_means_paralelo_e_reprodutivel_com_a_mesma_semente(dados):
+    sementes = []
+
+    for _ in range(2):
+        operadores.semeia_gerador(7)
+        sementes.append(operadores.gera_centroides_k_means_paralelo(dados, 6, np.empty((0, 2))))
+
+    np.testing.assert_array_equal(sementes[0], sementes[1])
+
+
+# noinspection SpellCheckingInspection
+def test_reajuste_incremental_parte_da_solucao_anterior(dados):
+    k_medias = KMedias(numero_de_centroides=4, tolerancia=0.0)
+    k_medias.clusteriza_dados(dados=dados, centroides_fixos=None, numero_de_execucoes=5)
+    novas_observacoes = np.random.default_rng(1).normal(loc=5.0, size=(50, 2))
+
+    k_medias.adiciona_observacoes(dados=novas_observacoes)
+    k_medias.reajusta()
+
+    assert k_medias.dados.shape[0] == dados.shape[0] + novas_observacoes.shape[0]
+    np.testing.assert_array_equal(k_medias.rotulos, k_medias.prediz(dados=np.concatenate((dados, novas_observacoes))))
+
+
+# noinspection SpellCheckingInspection
+def test_reajuste_termina_com_centroides_nas_medias_dos_rotulos(dados):
+    k_medias = KMedias(numero_de_centroides=4, tolerancia=0.0)
+    k_medias.clusteriza_dados(dados=dados, centroides_fixos=None, numero_de_execucoes=5)
+    novas_observacoes = np.random.default_rng(2).normal(loc=(20.0, 5.0), size=(300, 2))
+    todas_as_observacoes = np.concatenate((dados, novas_observacoes))
+
+    k_medias.adiciona_observacoes(dados=novas_observacoes)
+    k_medias.reajusta()
+    medias = np.array([todas_as_observacoes[k_medias.rotulos == rotulo].mean(axis=0) for rotulo in range(4)])
+
+    assert k_medias.iteracoes_por_criterio["deslocamento"] > 1
+    np.testing.assert_allclose(k_medias.centroides, medias)
+
+
+# noinspection SpellCheckingInspection
+def test_reajuste_repara_agrupamentos_esvaziados(dados):
+    k_medias = KMedias(numero_de_centroides=4, tolerancia=0.0)
+    ajusta(k_medias, dados, dados[[0, 200, 400, 600]])
+
+    k_medias.remove_observacoes(indices=np.flatnonzero(k_medias.rotulos == k_medias.rotulos[600]))
+    k_medias.reajusta()
+
+    assert k_medias.resultado.reparos == 1
+    assert (k_medias.resultado.numero_de_membros > 0).all()
+    assert np.isfinite(k_medias.centroides).all()
+    assert np.isfinite(k_medias.erro)
@@ -0,0 +1,38 @@
+import numpy as np
+
+from kmedias import KMedias
+from kmedias import metricas
+
+
+# noinspection SpellCheckingInspection
+def test_projecao_na_esfera_ida_e_volta():
+    coordenadas = np.random.default_rng(0).uniform((-180.0, -89.0), (180.0, 89.0), size=(100, 2))
+    vetores = metricas.projeta(coordenadas, metricas.GEODESICA)
+
+    np.testing.assert_allclose(np.linalg.norm(vetores, axis=1), 1.0)
+    np.testing.assert_allclose(metricas.desprojeta(vetores, metricas.GEODESICA), coordenadas, atol=1e-9)
+
+
+# noinspection SpellCheckingInspection
+def test_cordas_viram_arcos_em_quilometros():
+    vetores = metricas.projeta(np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 90.0]]), metricas.GEODESICA)
+    cordas = np.linalg.norm(vetores[1:] - vetores[0], axis=1)
+
+    np.testing.assert_allclose(
+        metricas.converte_distancias(cordas, metricas.GEODESICA), np.radians([1.0, 90.0]) * metricas.RAIO_DA_TERRA
+    )
+
+
+# noinspection SpellCheckingInspection
+def test_ajuste_geodesico_encontra_os_centros_em_graus():
+    gerador = np.random.default_rng(0)
+    centros = np.array([[-48.48, -1.45], [-46.63, -23.55], [179.9, 10.0], [-179.9, -10.0]])
+    coordenadas = np.concatenate([centro + gerador.normal(scale=0.01, size=(100, 2)) for centro in centros])
+    coordenadas[:, 0] = (coordenadas[:, 0] + 180.0) % 360.0 - 180.0
+    k_medias = KMedias(numero_de_centroides=4, metrica=metricas.GEODESICA)
+    resultados = k_medias.clusteriza_dados(dados=coordenadas, centroides_fixos=centros[:1], numero_de_execucoes=10)
+    melhor_solucao = resultados.melhor_solucao
+    ordem = [np.argmin(np.abs(melhor_solucao - centro).sum(axis=1)) for centro in centros]
+
+    np.testing.assert_allclose(melhor_solucao[ordem], centros, atol=0.01)
+    assert 1.0 < resultados.melhor_erro / coordenadas.shape[0] < 4.0
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from kmedias import KMedias
+from kmedias import multiplas_execucoes
+from kmedias import operadores
+
+
+# noinspection SpellCheckingInspection
+def test_lote_chega_as_solucoes_do_laco_sequencial(dados):
+    gerador = np.random.default_rng(0)
+    centroides_iniciais = np.stack([dados[gerador.choice(dados.shape[0], 5, replace=False)] for _ in range(12)])
+    centroides_fixos = np.zeros(5, dtype=np.bool_)
+    _, solucoes, erros, _, situacoes, _, _ = multiplas_execucoes.roda_k_means_em_lote(
+        dados, centroides_iniciais, centroides_fixos, 0.0
+    )
+    convergidas = np.flatnonzero(situacoes == multiplas_execucoes.CONVERGIDA)
+
+    assert convergidas.shape[0] > 0
+
+    for e in convergidas:
+        resultado = operadores.roda_k_means(dados, centroides_iniciais[e], centroides_fixos, 0.0)
+
+        np.testing.assert_allclose(solucoes[e], resultado.centroides)
+        np.testing.assert_allclose(erros[e], resultado.erro_dos_agrupamentos.sum())
+
+
+# noinspection SpellCheckingInspection
+def test_lote_abandona_execucoes_repetidas(dados):
+    centroides_iniciais, centroides_fixos = np.stack([dados[[0, 200, 400, 600]]] * 3), np.zeros(4, dtype=np.bool_)
+    indice_da_melhor, solucoes, _, _, situacoes, _, _ = multiplas_execucoes.roda_k_means_em_lote(
+        dados, centroides_iniciais, centroides_fixos, 0.0
+    )
+    resultado = operadores.roda_k_means(dados, centroides_iniciais[0], centroides_fixos, 0.0)
+
+    np.testing.assert_array_equal(
+        situacoes, [multiplas_execucoes.CONVERGIDA, multiplas_execucoes.ABANDONADA, multiplas_execucoes.ABANDONADA]
+    )
+    assert indice_da_melhor == 0
+    np.testing.assert_allclose(solucoes[0], resultado.centroides)
+
+
+# noinspection SpellCheckingInspection
+@pytest.mark.parametrize("parametros", [{"acelerado": True}, {"criterio_de_parada": "rotulos"}])
+def test_opcoes_sem_suporte_no_lote_usam_o_laco_sequencial(dados, parametros):
+    k_medias = KMedias(numero_de_centroides=4, **parametros)
+    resultados = k_medias.clusteriza_dados(dados=dados, centroides_fixos=None, numero_de_execucoes=3)
+
+    assert len(resultados) == 3
+    assert np.isfinite(resultados.erros).all()
+
+    if parametros.get("acelerado"):
+        assert k_medias.iteracoes_por_criterio["inercia"] == -1
+
+
+# noinspection SpellCheckingInspection
+def test_acumulacao_em_partes_equivale_a_rotulacao_de_cada_execucao(dados):
+    gerador = np.random.default_rng(1)
+    centroides = np.stack([dados[gerador.choice(dados.shape[0], 50, replace=False)] for _ in range(100)])
+    somas, numero_de_membros, erros = multiplas_execucoes.rotula_e_acumula_execucoes(
+        dados, centroides, (dados ** 2).sum(axis=1)
+    )
+
+    for e in range(0, 100, 17):
+        distancias = ((dados[:, np.newaxis, :] - centroides[e][np.newaxis, :, :]) ** 2).sum(axis=2)
+        rotulos = distancias.argmin(axis=1)
+
+        np.testing.assert_array_equal(numero_de_membros[e], np.bincount(rotulos, minlength=50))
+        np.testing.assert_allclose(somas[e, :, 0], np.bincount(rotulos, dados[:, 0], minlength=50))
+        np.testing.assert_allclose(erros[e].sum(), distancias.min(axis=1).sum(), atol=1e-6)
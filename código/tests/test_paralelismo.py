@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from kmedias import paralelismo
+
+SCRIPT = """
+import numpy as np
+
+from kmedias import paralelismo
+
+if __name__ == "__main__":
+    gerador = np.random.default_rng(0)
+    dados = gerador.normal(size=(500, 2)) + gerador.integers(0, 3, size=(500, 1)) * 10.0
+    resultados = paralelismo.clusteriza_em_paralelo(
+        dados=dados, numero_de_centroides=3, centroides_fixos=None, numero_de_execucoes=8,
+        numero_de_trabalhadores=2, semente=0
+    )
+    print(len(resultados))
+"""
+
+SCRIPT_COM_CACHE = """
+import numpy as np
+
+from kmedias import multiplas_execucoes
+from kmedias import operadores
+from kmedias import paralelismo
+
+dados = np.random.default_rng(0).normal(size=(500, 2))
+centroides_fixos = np.zeros(4, dtype=np.bool_)
+configuracao = {
+    "numero_de_centroides": 4, "centroides_fixos": None, "origem": None, "numero_de_melhores": None, "parametros": {}
+}
+operadores.semeia_gerador(0)
+print({chamada})
+"""
+
+CHAMADAS_COM_CACHE = (
+    "operadores.roda_k_means(dados, dados[:4].copy(), centroides_fixos).centroides.shape[0]",
+    "multiplas_execucoes.roda_k_means_em_lote(dados, np.stack([dados[:4]] * 2), centroides_fixos)[1].shape[1]",
+    "len(paralelismo.executa_tarefa({'dados': dados}, configuracao, 0, 4, 1))",
+)
+
+
+# noinspection SpellCheckingInspection
+def roda_script(caminho, script, **variaveis):
+    caminho.write_text(script)
+
+    return subprocess.run(
+        [sys.executable, str(caminho)], capture_output=True, text=True, timeout=60,
+        env={**os.environ, "PYTHONPATH": os.path.dirname(os.path.dirname(paralelismo.__file__)), **variaveis}
+    )
+
+
+# noinspection SpellCheckingInspection
+def test_modo_processos_termina_o_interpretador(tmp_path):
+    processo = roda_script(tmp_path / "script.py", SCRIPT)
+
+    assert processo.returncode == 0, processo.stderr
+    assert processo.stdout.strip() == "8"
+
+
+# noinspection SpellCheckingInspection
+def test_modo_threads_recusa_a_camada_workqueue(tmp_path):
+    script = SCRIPT.replace("semente=0", "semente=0, modo=\"threads\"")
+    processo = roda_script(tmp_path / "script.py", script, NUMBA_THREADING_LAYER="workqueue")
+
+    assert processo.returncode == 1
+    assert "workqueue" in processo.stderr.splitlines()[-1]
+
+
+# noinspection SpellCheckingInspection
+@pytest.mark.parametrize("chamada", CHAMADAS_COM_CACHE)
+def test_nucleos_do_cache_rodam_num_interpretador_novo(tmp_path, chamada):
+    for _ in range(2):
+        processo = roda_script(tmp_path / "script.py", SCRIPT_COM_CACHE.replace("{chamada}", chamada))
+
+        assert processo.returncode == 0, processo.stderr
+        assert processo.stdout.strip() == "4"
+
+
+# noinspection SpellCheckingInspection
+@pytest.mark.parametrize("parametros", [{"precisao": "simples"}, {"metrica": "geodesica"}])
+def test_tarefas_recebem_os_dados_no_espaco_de_trabalho(dados, parametros):
+    coordenadas = dados / 20.0 - 40.0
+    resultados = paralelismo.clusteriza_em_paralelo(
+        dados=coordenadas, numero_de_centroides=4, centroides_fixos=coordenadas[:1], numero_de_execucoes=8,
+        numero_de_trabalhadores=2, modo="threads", semente=0, **parametros
+    )
+
+    np.testing.assert_allclose(resultados.solucoes[:, 0], np.repeat(coordenadas[:1], 8, axis=0), atol=1e-4)
+    assert np.isfinite(resultados.erros).all()
@@ -0,0 +1,46 @@
+import numpy as np
+
+from kmedias import KMedias
+from kmedias import metricas
+from kmedias import operadores
+from kmedias import predicao
+
+
+# noinspection SpellCheckingInspection
+def test_prediz_e_transforma_aceitam_uma_observacao_ou_um_lote(dados):
+    k_medias = KMedias(numero_de_centroides=4)
+    k_medias.clusteriza_dados(dados=dados, centroides_fixos=None, numero_de_execucoes=5)
+    rotulos, distancias = k_medias.prediz(dados=dados), k_medias.transforma(dados=dados)
+
+    np.testing.assert_array_equal(rotulos, k_medias.rotulos)
+    np.testing.assert_allclose(distancias.min(axis=1), k_medias.resultado.distancias, atol=1e-6)
+    assert k_medias.prediz(dados=dados[7]) == rotulos[7]
+    np.testing.assert_allclose(k_medias.transforma(dados=dados[7]), distancias[7])
+
+
+# noinspection SpellCheckingInspection
+def test_transforma_geodesico_devolve_quilometros():
+    coordenadas = np.array([[0.0, 0.0], [0.0, 1.0], [90.0, 0.0], [90.0, 1.0]])
+    k_medias = KMedias(numero_de_centroides=2, metrica=metricas.GEODESICA)
+    k_medias.dados = coordenadas
+    k_medias.centroides = coordenadas[[0, 2]]
+    distancias = k_medias.transforma(dados=np.array([[0.0, 1.0], [45.0, 0.0]]))
+    um_grau = np.radians(1.0) * metricas.RAIO_DA_TERRA
+
+    np.testing.assert_allclose(distancias, [[um_grau, 90 * um_grau], [45 * um_grau, 45 * um_grau]], rtol=1e-6)
+    np.testing.assert_array_equal(k_medias.prediz(dados=np.array([[1.0, 0.0], [89.0, 0.0]])), [0, 1])
+
+
+# noinspection SpellCheckingInspection
+def test_arvore_concorda_com_o_produto_de_matrizes(dados):
+    numero_de_centroides = predicao.LIMITE_DE_CENTROIDES_PARA_ARVORE + 1
+    centroides = dados[np.random.default_rng(0).choice(dados.shape[0], numero_de_centroides, replace=False)]
+    indice = predicao.IndiceDeCentroides(centroides=centroides)
+    rotulos, distancias = indice.rotula(dados)
+    rotulos_esperados, distancias_quadradas = operadores.rotula_dados_e_calcula_distancias(
+        dados, centroides, (dados ** 2).sum(axis=1)
+    )
+
+    assert indice.arvore is not None
+    np.testing.assert_array_equal(rotulos, rotulos_esperados)
+    np.testing.assert_allclose(distancias, np.sqrt(distancias_quadradas), atol=1e-6)
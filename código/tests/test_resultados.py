@@ -0,0 +1,39 @@
+import numpy as np
+
+from kmedias import resultados
+
+
+# noinspection SpellCheckingInspection
+def cria_resultados(erros, numero_de_melhores=None):
+    resultados_das_execucoes = resultados.ResultadosDasExecucoes(
+        numero_de_execucoes=len(erros), numero_de_centroides=2, dimensionalidade=2,
+        numero_de_melhores=numero_de_melhores
+    )
+
+    return resultados_das_execucoes.adiciona(
+        solucoes=np.arange(len(erros) * 4, dtype=np.float64).reshape(-1, 2, 2), erros=erros,
+        iteracoes=np.ones(len(erros), dtype=np.int_), situacoes=np.ones(len(erros), dtype=np.int8),
+        reparos=np.zeros(len(erros), dtype=np.int_)
+    )
+
+
+# noinspection SpellCheckingInspection
+def test_combina_mantem_os_melhores():
+    melhores = cria_resultados([5.0, 3.0, 4.0], numero_de_melhores=2)
+    melhores.combina(cria_resultados([1.0, 6.0]), cria_resultados([2.0]))
+
+    np.testing.assert_array_equal(np.sort(melhores.erros), [1.0, 2.0])
+    assert melhores.execucoes_registradas == 6
+    assert melhores.melhor_erro == 1.0
+
+
+# noinspection SpellCheckingInspection
+def test_salva_e_carrega(tmp_path):
+    resultados_das_execucoes = cria_resultados([3.0, 1.0, 2.0])
+    caminho = tmp_path / "resultados.npz"
+
+    resultados_das_execucoes.salva(caminho=caminho)
+    carregados = resultados.ResultadosDasExecucoes.carrega(caminho=caminho)
+
+    np.testing.assert_array_equal(carregados.erros, resultados_das_execucoes.erros)
+    np.testing.assert_array_equal(carregados.melhor_solucao, resultados_das_execucoes.melhor_solucao)
@@ -0,0 +1,29 @@
+import numpy as np
+
+from kmedias import varredura
+
+
+# noinspection SpellCheckingInspection
+def test_varredura_mantem_os_centroides_fixos(dados):
+    centroides_fixos = np.array([[5.0, 5.0], [-5.0, -5.0]])
+    varredura_com_fixos = varredura.varre_numeros_de_centroides(
+        dados=dados, numeros_de_centroides=[3, 4, 6], centroides_fixos=centroides_fixos, semente=0
+    )
+
+    assert varredura_com_fixos["Número de centroides"].tolist() == [3, 4, 6]
+
+    for linha in varredura_com_fixos.itertuples(index=False):
+        numero_de_centroides, solucao = linha[0], linha[1]
+
+        assert solucao.shape == (numero_de_centroides, 2)
+        np.testing.assert_array_equal(solucao[:2], centroides_fixos)
+
+    assert (np.diff(varredura_com_fixos["Erro"]) < 0.0).all()
+
+
+# noinspection SpellCheckingInspection
+def test_varredura_encontra_o_cotovelo_dos_agrupamentos(dados):
+    varredura_livre = varredura.varre_numeros_de_centroides(dados=dados, numeros_de_centroides=range(2, 8), semente=0)
+
+    assert varredura_livre.loc[varredura_livre["Cotovelo"], "Número de centroides"].tolist() == [4]
+    assert varredura_livre["Silhueta"].idxmax() == 2